@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Prebuild the circuit breaker catalog for the recommendation engine
+
+Writes cb_catalog.npy (one fixed-width record per breaker) and
+cb_catalog.json (fingerprint and row metadata) next to
+sizing_recommendation_engine.py. Engines memory-map the .npy file so
+worker processes share it; a stale file is ignored and the table is
+rebuilt in memory. Re-run after editing the breaker catalog.
+"""
+
+import argparse
+import json
+import logging
+
+import numpy as np
+
+from sizing_recommendation_engine import (
+    CircuitBreakerRecommendationEngine,
+    _CB_CATALOG_META_PATH,
+    _CB_CATALOG_PATH,
+    _breaker_records,
+    _catalog_fingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+def build_catalog():
+    """Write the breaker record array and its metadata"""
+    engine = CircuitBreakerRecommendationEngine()
+    records = _breaker_records(engine._cb_slices, engine._cb_entries)
+    np.save(_CB_CATALOG_PATH, records, allow_pickle=False)
+    
+    meta = {
+        'fingerprint': _catalog_fingerprint(engine._cb_entries),
+        'rows': len(records),
+        'manufacturers': list(engine._cb_slices),
+        'part_numbers': [breaker['part_number'] for breaker in engine._cb_entries],
+    }
+    with open(_CB_CATALOG_META_PATH, 'w') as meta_file:
+        json.dump(meta, meta_file, indent=2)
+        meta_file.write('\n')
+    
+    logger.info("Wrote %d breaker records to %s", len(records), _CB_CATALOG_PATH)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-v', '--verbose', action='store_true', help='Enable debug logging')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format='%(message)s')
+    build_catalog()
+
+if __name__ == "__main__":
+    main()
@@ -304,6 +304,27 @@ class ElectricalCalculations:
             }
         }
     
+    def batch_size(self, specs):
+        """
+        Run several sizing calculations in one call
+        
+        Args:
+            specs: Dicts with a 'type' ('conductor' or 'transformer') and the
+                keyword arguments of size_conductor or transformer_sizing
+        
+        Returns:
+            list: Sizing results in the same order as specs
+        """
+        calculations = {
+            'conductor': self.size_conductor,
+            'transformer': self.transformer_sizing
+        }
+        results = []
+        for spec in specs:
+            arguments = dict(spec)
+            results.append(calculations[arguments.pop('type')](**arguments))
+        return results
+    
     def _get_load_flow_recommendations(self, voltage_regulation, efficiency):
         """Generate recommendations based on load flow results"""
         recommendations = []
@@ -5,6 +5,13 @@ Configuration settings for Electrical PM Application
 import os
 from datetime import timedelta
 
+# Persisted supplier OAuth tokens live in a per-user cache directory, never a
+# shared temp path another account could create first
+DEFAULT_SUPPLIER_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'electrical_pm', 'supplier_cache'
+)
+
 class Config:
     """Base configuration class"""
     
@@ -26,6 +33,9 @@ class Config:
     # Material Pricing Configuration
     MATERIAL_PRICE_CACHE_TIMEOUT = 3600  # 1 hour
     SUPPLIER_API_TIMEOUT = 30  # seconds
+    SUPPLIER_CACHE_TTL = 24 * 3600  # seconds; None caches supplier lookups for the process lifetime
+    # Persisted OAuth tokens; an empty value disables persistence
+    SUPPLIER_CACHE_DIR = os.environ.get('SUPPLIER_CACHE_DIR', DEFAULT_SUPPLIER_CACHE_DIR)
     
     # Calculation Engine Configuration
     MAX_CALCULATION_DISTANCE = 10000  # feet
@@ -15,10 +15,61 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.platypus import Image as ReportLabImage
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from datetime import datetime
+import argparse
 import json
-from typing import Dict, List, Any, Optional
+import logging
+from typing import Dict, List, Any, Optional, BinaryIO
 import os
 
+from script_logging import configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Table styles and text templates shared by every report, built once at import
+_PROJECT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+])
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('BACKGROUND', (0, 1), (0, -1), colors.lightgrey),
+])
+
+_ANALYSIS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('BACKGROUND', (0, 1), (0, -1), colors.lightgreen),
+])
+
+_PRODUCT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
+_PRICE_FMT = "${:.2f}".format
+_FOOTER_GENERATED = "Generated by Enhanced Electrical Engineering System v2.0 on {:%Y-%m-%d %H:%M:%S}".format
+_FOOTER_DISCLAIMER = "This report is for engineering reference only. Professional engineer review required for final design."
+
 class ElectricalEngineeringReportGenerator:
     """Generate professional electrical engineering reports"""
     
@@ -80,16 +131,44 @@ class ElectricalEngineeringReportGenerator:
             borderWidth=1,
             borderPadding=5
         )
+        
+        # Footer style
+        self.footer_style = ParagraphStyle(
+            'Footer',
+            parent=self.styles['Normal'],
+            fontSize=8,
+            alignment=TA_CENTER,
+            textColor=colors.grey
+        )
     
-    def generate_cable_sizing_report(self, calculation_result: Dict, recommendations: Dict, project_info: Dict) -> str:
-        """Generate comprehensive cable sizing report"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"cable_sizing_report_{timestamp}.pdf"
-        filepath = os.path.join(self.output_dir, filename)
+    def _write_report(self, story: List, filename: str, stream: Optional[BinaryIO] = None) -> str:
+        """Serialize the report story into an open binary file.
+
+        When ``stream`` is given (e.g. an HTTP response body or BytesIO) the PDF
+        is written straight into it and nothing is saved under ``output_dir``;
+        otherwise the report file is opened once and handed to ReportLab.
+        """
+        if stream is not None:
+            self._build_document(story, stream)
+            return filename
         
-        doc = SimpleDocTemplate(filepath, pagesize=letter,
+        filepath = os.path.join(self.output_dir, filename)
+        with open(filepath, 'wb') as f:
+            self._build_document(story, f)
+        return filepath
+    
+    def _build_document(self, story: List, target: BinaryIO):
+        """Lay out the story on letter pages and write the PDF to ``target``"""
+        doc = SimpleDocTemplate(target, pagesize=letter,
                               rightMargin=72, leftMargin=72,
                               topMargin=72, bottomMargin=18)
+        doc.build(story)
+    
+    def generate_cable_sizing_report(self, calculation_result: Dict, recommendations: Dict, project_info: Dict,
+                                     stream: Optional[BinaryIO] = None) -> str:
+        """Generate comprehensive cable sizing report"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"cable_sizing_report_{timestamp}.pdf"
         
         story = []
         
@@ -108,14 +187,7 @@ class ElectricalEngineeringReportGenerator:
         ]
         
         project_table = Table(project_table_data, colWidths=[2*inch, 3*inch])
-        project_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ]))
+        project_table.setStyle(_PROJECT_TABLE_STYLE)
         story.append(project_table)
         story.append(Spacer(1, 30))
         
@@ -135,16 +207,7 @@ class ElectricalEngineeringReportGenerator:
         ]
         
         calc_table = Table(calc_data, colWidths=[2.5*inch, 1.5*inch, 1*inch])
-        calc_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (0, -1), colors.lightgrey),
-        ]))
+        calc_table.setStyle(_SUMMARY_TABLE_STYLE)
         story.append(calc_table)
         story.append(Spacer(1, 30))
         
@@ -213,19 +276,12 @@ class ElectricalEngineeringReportGenerator:
                     cable_data.append([
                         cable.get('part_number', 'N/A'),
                         cable.get('description', 'N/A')[:40] + '...',
-                        f"${cable.get('price_estimate', 0):.2f}",
+                        _PRICE_FMT(cable.get('price_estimate', 0)),
                         cable.get('availability', 'N/A')
                     ])
                 
                 cable_table = Table(cable_data, colWidths=[1.5*inch, 2.5*inch, 1*inch, 1*inch])
-                cable_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
+                cable_table.setStyle(_PRODUCT_TABLE_STYLE)
                 story.append(cable_table)
                 story.append(Spacer(1, 15))
         
@@ -246,29 +302,17 @@ class ElectricalEngineeringReportGenerator:
         story.append(Spacer(1, 20))
         
         # Footer
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            alignment=TA_CENTER,
-            textColor=colors.grey
-        )
-        story.append(Paragraph(f"Generated by Enhanced Electrical Engineering System v2.0 on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", footer_style))
-        story.append(Paragraph("This report is for engineering reference only. Professional engineer review required for final design.", footer_style))
+        story.append(Paragraph(_FOOTER_GENERATED(datetime.now()), self.footer_style))
+        story.append(Paragraph(_FOOTER_DISCLAIMER, self.footer_style))
         
         # Build PDF
-        doc.build(story)
-        return filepath
+        return self._write_report(story, filename, stream)
     
-    def generate_motor_sizing_report(self, calculation_result: Dict, recommendations: Dict, project_info: Dict) -> str:
+    def generate_motor_sizing_report(self, calculation_result: Dict, recommendations: Dict, project_info: Dict,
+                                     stream: Optional[BinaryIO] = None) -> str:
         """Generate comprehensive motor sizing report"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"motor_sizing_report_{timestamp}.pdf"
-        filepath = os.path.join(self.output_dir, filename)
-        
-        doc = SimpleDocTemplate(filepath, pagesize=letter,
-                              rightMargin=72, leftMargin=72,
-                              topMargin=72, bottomMargin=18)
         
         story = []
         
@@ -287,14 +331,7 @@ class ElectricalEngineeringReportGenerator:
         ]
         
         project_table = Table(project_table_data, colWidths=[2*inch, 3*inch])
-        project_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ]))
+        project_table.setStyle(_PROJECT_TABLE_STYLE)
         story.append(project_table)
         story.append(Spacer(1, 30))
         
@@ -314,16 +351,7 @@ class ElectricalEngineeringReportGenerator:
         ]
         
         calc_table = Table(calc_data, colWidths=[2.5*inch, 1.5*inch, 1*inch])
-        calc_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (0, -1), colors.lightgrey),
-        ]))
+        calc_table.setStyle(_SUMMARY_TABLE_STYLE)
         story.append(calc_table)
         story.append(Spacer(1, 30))
         
@@ -343,16 +371,7 @@ class ElectricalEngineeringReportGenerator:
             ]
             
             energy_table = Table(energy_data, colWidths=[2.5*inch, 1.5*inch, 1*inch])
-            energy_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('BACKGROUND', (0, 1), (0, -1), colors.lightgreen),
-            ]))
+            energy_table.setStyle(_ANALYSIS_TABLE_STYLE)
             story.append(energy_table)
             story.append(Spacer(1, 20))
         
@@ -370,20 +389,13 @@ class ElectricalEngineeringReportGenerator:
                     motor_data.append([
                         motor.get('part_number', 'N/A'),
                         motor.get('product_line', 'N/A')[:25] + '...' if len(motor.get('product_line', '')) > 25 else motor.get('product_line', 'N/A'),
-                        f"${motor.get('price_estimate', 0):.2f}",
+                        _PRICE_FMT(motor.get('price_estimate', 0)),
                         f"{motor.get('specifications', {}).get('efficiency_percent', 'N/A')}%",
                         motor.get('availability', 'N/A')
                     ])
                 
                 motor_table = Table(motor_data, colWidths=[1.5*inch, 2*inch, 1*inch, 1*inch, 1.5*inch])
-                motor_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
+                motor_table.setStyle(_PRODUCT_TABLE_STYLE)
                 story.append(motor_table)
                 story.append(Spacer(1, 15))
         
@@ -403,30 +415,18 @@ class ElectricalEngineeringReportGenerator:
             story.append(Paragraph(req, self.body_style))
         
         # Footer
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            alignment=TA_CENTER,
-            textColor=colors.grey
-        )
         story.append(Spacer(1, 20))
-        story.append(Paragraph(f"Generated by Enhanced Electrical Engineering System v2.0 on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", footer_style))
-        story.append(Paragraph("This report is for engineering reference only. Professional engineer review required for final design.", footer_style))
+        story.append(Paragraph(_FOOTER_GENERATED(datetime.now()), self.footer_style))
+        story.append(Paragraph(_FOOTER_DISCLAIMER, self.footer_style))
         
         # Build PDF
-        doc.build(story)
-        return filepath
+        return self._write_report(story, filename, stream)
     
-    def generate_circuit_breaker_report(self, calculation_result: Dict, recommendations: Dict, project_info: Dict) -> str:
+    def generate_circuit_breaker_report(self, calculation_result: Dict, recommendations: Dict, project_info: Dict,
+                                        stream: Optional[BinaryIO] = None) -> str:
         """Generate comprehensive circuit breaker sizing report"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"breaker_sizing_report_{timestamp}.pdf"
-        filepath = os.path.join(self.output_dir, filename)
-        
-        doc = SimpleDocTemplate(filepath, pagesize=letter,
-                              rightMargin=72, leftMargin=72,
-                              topMargin=72, bottomMargin=18)
         
         story = []
         
@@ -445,14 +445,7 @@ class ElectricalEngineeringReportGenerator:
         ]
         
         project_table = Table(project_table_data, colWidths=[2*inch, 3*inch])
-        project_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ]))
+        project_table.setStyle(_PROJECT_TABLE_STYLE)
         story.append(project_table)
         story.append(Spacer(1, 30))
         
@@ -471,16 +464,7 @@ class ElectricalEngineeringReportGenerator:
         ]
         
         calc_table = Table(calc_data, colWidths=[2.5*inch, 1.5*inch, 1*inch])
-        calc_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (0, -1), colors.lightgrey),
-        ]))
+        calc_table.setStyle(_SUMMARY_TABLE_STYLE)
         story.append(calc_table)
         story.append(Spacer(1, 30))
         
@@ -500,16 +484,7 @@ class ElectricalEngineeringReportGenerator:
             ]
             
             protection_table = Table(protection_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch])
-            protection_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('BACKGROUND', (0, 1), (0, -1), colors.lightgreen),
-            ]))
+            protection_table.setStyle(_ANALYSIS_TABLE_STYLE)
             story.append(protection_table)
             story.append(Spacer(1, 20))
         
@@ -527,20 +502,13 @@ class ElectricalEngineeringReportGenerator:
                     breaker_data.append([
                         breaker.get('part_number', 'N/A'),
                         breaker.get('product_line', 'N/A')[:20] + '...' if len(breaker.get('product_line', '')) > 20 else breaker.get('product_line', 'N/A'),
-                        f"${breaker.get('price_estimate', 0):.2f}",
+                        _PRICE_FMT(breaker.get('price_estimate', 0)),
                         breaker.get('specifications', {}).get('interruption_capacity', 'N/A'),
                         breaker.get('availability', 'N/A')
                     ])
                 
                 breaker_table = Table(breaker_data, colWidths=[1.5*inch, 2*inch, 1*inch, 1.5*inch, 1*inch])
-                breaker_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
+                breaker_table.setStyle(_PRODUCT_TABLE_STYLE)
                 story.append(breaker_table)
                 story.append(Spacer(1, 15))
         
@@ -560,25 +528,16 @@ class ElectricalEngineeringReportGenerator:
             story.append(Paragraph(item, self.body_style))
         
         # Footer
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            alignment=TA_CENTER,
-            textColor=colors.grey
-        )
         story.append(Spacer(1, 20))
-        story.append(Paragraph(f"Generated by Enhanced Electrical Engineering System v2.0 on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", footer_style))
-        story.append(Paragraph("This report is for engineering reference only. Professional engineer review required for final design.", footer_style))
+        story.append(Paragraph(_FOOTER_GENERATED(datetime.now()), self.footer_style))
+        story.append(Paragraph(_FOOTER_DISCLAIMER, self.footer_style))
         
         # Build PDF
-        doc.build(story)
-        return filepath
+        return self._write_report(story, filename, stream)
 
 def test_report_generation():
     """Test the report generation system"""
-    print("Testing Professional Report Generation")
-    print("=" * 40)
+    logger.info("Testing Professional Report Generation\n%s", "=" * 40)
     
     # Test data
     test_calculation = {
@@ -612,19 +571,24 @@ def test_report_generation():
     # Generate reports
     generator = ElectricalEngineeringReportGenerator()
     
-    print("📄 Generating Cable Sizing Report...")
+    logger.info("📄 Generating Cable Sizing Report...")
     cable_report = generator.generate_cable_sizing_report(test_calculation, test_recommendations, test_project_info)
-    print(f"✅ Cable report generated: {cable_report}")
+    logger.info("✅ Cable report generated: %s", cable_report)
     
-    print("📄 Generating Motor Sizing Report...")
+    logger.info("📄 Generating Motor Sizing Report...")
     motor_report = generator.generate_motor_sizing_report(test_calculation, test_recommendations, test_project_info)
-    print(f"✅ Motor report generated: {motor_report}")
+    logger.info("✅ Motor report generated: %s", motor_report)
     
-    print("📄 Generating Circuit Breaker Report...")
+    logger.info("📄 Generating Circuit Breaker Report...")
     breaker_report = generator.generate_circuit_breaker_report(test_calculation, test_recommendations, test_project_info)
-    print(f"✅ Breaker report generated: {breaker_report}")
+    logger.info("✅ Breaker report generated: %s", breaker_report)
     
-    print("\n🎉 All professional reports generated successfully!")
+    logger.info("🎉 All professional reports generated successfully!")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate sample engineering reports")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Show report generation progress')
+    args = parser.parse_args()
+    configure_logging(logger, args.verbose)
     test_report_generation()
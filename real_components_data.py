@@ -3,6 +3,9 @@ Real Component Database
 Contains curated list of actual electrical components from requested manufacturers.
 """
 
+from functools import cache
+from types import MappingProxyType
+
 REAL_COMPONENTS = [
     # Schneider Electric
     {
@@ -105,8 +108,18 @@ REAL_COMPONENTS = [
     }
 ]
 
-def get_real_components(manufacturer=None):
-    """Retrieve components, optionally filtered by manufacturer"""
+# Read-only views of the entries, shared by every cached result
+_READ_ONLY_COMPONENTS = tuple(MappingProxyType(c) for c in REAL_COMPONENTS)
+
+@cache
+def get_real_components(manufacturer: str | None = None) -> tuple:
+    """Retrieve components, optionally filtered by manufacturer.
+
+    The catalog is static for the life of the process, so results are memoized
+    per manufacturer. They are tuples of read-only mappings, so callers cannot
+    mutate the shared cache.
+    """
     if manufacturer:
-        return [c for c in REAL_COMPONENTS if manufacturer.lower() in c['manufacturer'].lower()]
-    return REAL_COMPONENTS
+        manufacturer = manufacturer.lower()
+        return tuple(c for c in _READ_ONLY_COMPONENTS if manufacturer in c['manufacturer'].lower())
+    return _READ_ONLY_COMPONENTS
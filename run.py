@@ -3,22 +3,28 @@
 Startup script for Electrical Construction PM Application
 """
 
+import argparse
+import logging
 import os
 import sys
 from app import app, db
+from script_logging import configure_logging
+
+logger = logging.getLogger(__name__)
 
 def initialize_database():
     """Initialize the database with tables"""
-    print("Initializing database...")
+    logger.info("Initializing database...")
     with app.app_context():
         db.create_all()
-        print("Database initialized successfully!")
+        logger.info("Database initialized successfully!")
 
 def run_development_server():
     """Run the development server"""
-    print("Starting Electrical PM Application...")
-    print("Access the application at: http://localhost:5000")
-    print("Press Ctrl+C to stop the server")
+    # Always shown, with or without --verbose
+    print("Starting Electrical PM Application...\n"
+          "Access the application at: http://localhost:5000\n"
+          "Press Ctrl+C to stop the server")
     
     try:
         app.run(
@@ -28,7 +34,7 @@ def run_development_server():
             use_reloader=True
         )
     except KeyboardInterrupt:
-        print("\nServer stopped by user")
+        logger.info("Server stopped by user")
 
 def check_dependencies():
     """Check if all required dependencies are installed"""
@@ -45,10 +51,13 @@ def check_dependencies():
             missing_packages.append(package)
     
     if missing_packages:
-        print(f"Missing required packages: {', '.join(missing_packages)}")
-        print("Please install them using:")
-        print(f"pip install {' '.join(missing_packages)}")
-        print("Or run: pip install -r requirements.txt")
+        logger.error(
+            "Missing required packages: %s\n"
+            "Please install them using:\n"
+            "pip install %s\n"
+            "Or run: pip install -r requirements.txt",
+            ', '.join(missing_packages), ' '.join(missing_packages)
+        )
         return False
     
     return True
@@ -57,17 +66,27 @@ def create_directories():
     """Create necessary directories if they don't exist"""
     directories = ['uploads', 'static', 'models']
     
-    for directory in directories:
+    # Directories already exist on warm starts; skip the mkdir syscall then
+    created = [d for d in directories if not os.path.isdir(d)]
+    for directory in created:
         os.makedirs(directory, exist_ok=True)
-        print(f"Directory created/verified: {directory}")
+    logger.info("Directories verified: %s (created: %s)",
+                ', '.join(directories), ', '.join(created) or 'none')
 
 def main():
     """Main function to start the application"""
-    print("=" * 60)
-    print("ELECTRICAL CONSTRUCTION PROJECT MANAGEMENT")
-    print("AI-Powered Cost Estimation & Material Management")
-    print("=" * 60)
-    print()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Show startup progress messages')
+    args = parser.parse_args()
+    configure_logging(logger, args.verbose)
+
+    logger.info("\n".join([
+        "=" * 60,
+        "ELECTRICAL CONSTRUCTION PROJECT MANAGEMENT",
+        "AI-Powered Cost Estimation & Material Management",
+        "=" * 60,
+    ]))
     
     # Check dependencies
     if not check_dependencies():
@@ -79,15 +98,15 @@ def main():
     # Initialize database
     initialize_database()
     
-    print()
-    print("Application ready!")
-    print("Features available:")
-    print("• Project creation and management")
-    print("• Electrical calculations (load flow, voltage drop, fault current)")
-    print("• AI-powered cost estimation")
-    print("• Real-time material pricing")
-    print("• Risk assessment and project tracking")
-    print()
+    print("\n".join([
+        "Application ready!",
+        "Features available:",
+        "• Project creation and management",
+        "• Electrical calculations (load flow, voltage drop, fault current)",
+        "• AI-powered cost estimation",
+        "• Real-time material pricing",
+        "• Risk assessment and project tracking",
+    ]))
     
     # Start the server
     run_development_server()
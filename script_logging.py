@@ -0,0 +1,14 @@
+"""
+Logging setup shared by the command-line scripts
+"""
+
+import logging
+
+def configure_logging(logger, verbose=False):
+    """Show a script's INFO progress messages only with --verbose
+
+    Only the script's own logger is quietened. The root logger (set to INFO by
+    app.py on import) and werkzeug's access log keep their levels.
+    """
+    logging.basicConfig(level=logging.INFO)
+    logger.setLevel(logging.INFO if verbose else logging.WARNING)
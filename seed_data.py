@@ -3,11 +3,16 @@
 Sample data seeding script for Electrical PM Application
 """
 
+import argparse
 import json
+import logging
 import random
 from datetime import datetime, timedelta
 from app import app
 from models import db, Project, Material, HistoricalProject
+from script_logging import configure_logging
+
+logger = logging.getLogger(__name__)
 
 def seed_projects():
     """Create sample projects"""
@@ -102,7 +107,7 @@ def seed_projects():
             created_projects.append(project)
         
         db.session.commit()
-        print(f"Created {len(created_projects)} sample projects")
+        logger.info("Created %d sample projects", len(created_projects))
     
     return created_projects
 
@@ -196,7 +201,7 @@ def seed_materials(projects):
             db.session.add(material)
         
         db.session.commit()
-        print(f"Created {len(materials_data)} sample material records")
+        logger.info("Created %d sample material records", len(materials_data))
 
 def seed_historical_projects():
     """Create historical project data for AI training"""
@@ -282,12 +287,17 @@ def seed_historical_projects():
             db.session.add(historical_project)
         
         db.session.commit()
-        print(f"Created {len(historical_data)} historical project records for AI training")
+        logger.info("Created %d historical project records for AI training", len(historical_data))
 
 def main():
     """Main seeding function"""
-    print("Seeding Electrical PM Application with sample data...")
-    print("=" * 60)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Show seeding progress and summary')
+    args = parser.parse_args()
+    configure_logging(logger, args.verbose)
+
+    logger.info("Seeding Electrical PM Application with sample data...\n%s", "=" * 60)
     
     with app.app_context():
         # Create tables if they don't exist
@@ -298,18 +308,23 @@ def main():
         seed_materials(projects)
         seed_historical_projects()
         
-        print("=" * 60)
-        print("Sample data seeding completed!")
-        print("\nYou can now:")
-        print("1. Run 'python run.py' to start the application")
-        print("2. Access http://localhost:5000 to view the dashboard")
-        print("3. Explore projects, calculations, and material estimates")
-        print("\nSample projects include:")
-        print("• Industrial Complex Phase 1 (30% complete)")
-        print("• Downtown Office Tower (Planning)")
-        print("• Residential Subdivision Phase 2 (Completed)")
-        print("• Substation Upgrade Project (On Hold)")
-        print("• Shopping Center Renovation (35% complete)")
+        lines = [
+            "=" * 60,
+            "Sample data seeding completed!",
+            "",
+            "You can now:",
+            "1. Run 'python run.py' to start the application",
+            "2. Access http://localhost:5000 to view the dashboard",
+            "3. Explore projects, calculations, and material estimates",
+            "",
+            "Sample projects include:",
+            "• Industrial Complex Phase 1 (30% complete)",
+            "• Downtown Office Tower (Planning)",
+            "• Residential Subdivision Phase 2 (Completed)",
+            "• Substation Upgrade Project (On Hold)",
+            "• Shopping Center Renovation (35% complete)",
+        ]
+        logger.info("\n".join(lines))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
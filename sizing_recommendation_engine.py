@@ -7,96 +7,663 @@ Date: 2025-11-29
 Version: 2.0
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+import hashlib
+import heapq
 import json
+import os
+import re
+import sys
+import weakref
 
-@dataclass
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+class Application(IntEnum):
+    """Breaker application; only MOTOR changes the recommendation reason"""
+    GENERAL = 0
+    MOTOR = 1
+    
+    @classmethod
+    def coerce(cls, value) -> 'Application':
+        """Accept an Application or the legacy 'general'/'motor' strings"""
+        if isinstance(value, cls):
+            return value
+        return cls.MOTOR if value == 'motor' else cls.GENERAL
+
+@dataclass(slots=True, frozen=True)
 class PartRecommendation:
     """Part number recommendation with full details"""
     manufacturer: str
     product_line: str
     part_number: str
     description: str
-    specifications: Dict[str, Any]
+    specifications: Mapping[str, Any] = field(hash=False)  # shared read-only view, excluded from hash
     datasheet_url: str
     price_estimate: float
     availability: str
     lead_time_days: int
     nec_compliant: bool
     reason_for_recommendation: str
+    
+    def to_json(self) -> bytes:
+        """Serialize the recommendation to UTF-8 JSON"""
+        return dumps_json(self)
+
+def _json_default(obj):
+    """Serialize the types orjson/json do not handle natively"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if isinstance(obj, PartRecommendation):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(obj) -> bytes:
+    """Serialize recommendations (or a recommend_* result dict) to UTF-8 JSON.
+
+    Uses orjson when installed and falls back to the standard library.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, default=_json_default).encode()
+
+# One bit per standard system voltage so compatibility is a single AND
+_VOLTAGE_BITS = {'120V': 1, '208V': 2, '240V': 4, '277V': 8, '480V': 16, '600V': 32}
+_BIT_480V = _VOLTAGE_BITS['480V']
+_BIT_UNLISTED = 0x40  # set on every breaker query; accepted by breakers not rated for 480V
+_BIT_OTHER = 0x80  # lists a voltage outside _VOLTAGE_BITS; resolved by exact comparison
+_BITS_EXACT = 0x7F  # every bit that matches on its own
+_ACCEPT_ALL = 0xFF
+_VOLTAGE_NUMBER = re.compile(r'\d+')
+
+# IEC efficiency class ranking; unknown classes rank as IE3
+_EFFICIENCY_RANK = {'IE1': 1, 'IE2': 2, 'IE3': 3, 'IE4': 4, 'IE5': 5}
+_EFF_DEFAULT = 3
+
+def _voltage_bits(voltage: str) -> int:
+    """Bitmask of the standard voltages listed in a rating such as '120/240V';
+    any other voltage sets _BIT_OTHER"""
+    bits = 0
+    for number in _VOLTAGE_NUMBER.findall(voltage):
+        bits |= _VOLTAGE_BITS.get(f"{number}V", _BIT_OTHER)
+    return bits
+
+def _query_voltage_bits(voltage: str) -> int:
+    """Bitmask for a requested voltage; an empty request matches every rating,
+    as the substring check it replaces did"""
+    return _voltage_bits(voltage) if voltage else _ACCEPT_ALL
+
+def _other_voltages(voltage: str) -> frozenset:
+    """The voltages in a rating that have no bit of their own, e.g. {'400'} for '400/690V'"""
+    return frozenset(number for number in _VOLTAGE_NUMBER.findall(voltage) if f"{number}V" not in _VOLTAGE_BITS)
+
+def _voltage_rows_ok(row_bits: np.ndarray, row_others: List[frozenset], query_bits: int, voltage: str) -> np.ndarray:
+    """Rows that share a voltage with the query. Standard voltages compare by
+    bit; voltages outside the table compare exactly against each row's list."""
+    ok = (row_bits & (query_bits & _BITS_EXACT)) != 0
+    if query_bits & _BIT_OTHER:
+        others = _other_voltages(voltage)
+        ok |= np.fromiter((not others.isdisjoint(row) for row in row_others), dtype=np.bool_, count=len(row_others))
+    return ok
+
+def _breaker_voltage_accept(bits: int) -> int:
+    """Query bits a breaker accepts: 480V-rated breakers only accept the
+    voltages they list, every other breaker accepts any query"""
+    return bits if bits & _BIT_480V else _ACCEPT_ALL
+
+def _breaker_voltage_query(voltage: str) -> int:
+    """Query mask for a requested voltage; a 480V request accepts every breaker"""
+    bits = _query_voltage_bits(voltage)
+    return _ACCEPT_ALL if bits & _BIT_480V else bits | _BIT_UNLISTED
+
+def _needs_exact_voltage(query_mask: int) -> bool:
+    """Whether a breaker query lists a voltage that bits alone cannot match"""
+    return query_mask != _ACCEPT_ALL and bool(query_mask & _BIT_OTHER)
+
+def _first_admissible(sorted_amps: np.ndarray, amp_rating: float) -> int:
+    """Position of the first breaker in an ascending amp array that passes amp_rating <= amp * 1.25"""
+    lo = int(np.searchsorted(sorted_amps, amp_rating / 1.25, side='left'))
+    # The division can round across a boundary; settle on the exact comparison
+    while lo > 0 and amp_rating <= sorted_amps[lo - 1] * 1.25:
+        lo -= 1
+    while lo < len(sorted_amps) and amp_rating > sorted_amps[lo] * 1.25:
+        lo += 1
+    return lo
+
+def _filter_and_topk(amp_ratings, voltage_accept, prices, lead_times, row_offsets, query_amp, query_mask, k=3):
+    """Indices of the k cheapest matching breakers per manufacturer.
+
+    Rows of manufacturer m are row_offsets[m]:row_offsets[m + 1]. Candidates
+    are ranked by (price, lead time) with ties kept in catalog order; unused
+    slots are -1. Checks run cheapest-first: the amp tolerance rejects most
+    rows, then voltage is a single AND. Compiled with numba when installed.
+    """
+    n_manufacturers = row_offsets.size - 1
+    out = np.full((n_manufacturers, k), -1, dtype=np.int64)
+    
+    for m in prange(n_manufacturers):
+        count = 0
+        for i in range(row_offsets[m], row_offsets[m + 1]):
+            if query_amp > amp_ratings[i] * 1.25:
+                continue
+            if (voltage_accept[i] & query_mask) == 0:
+                continue
+            
+            # Insert into the running top-k, after any equal keys
+            pos = count
+            while pos > 0:
+                j = out[m, pos - 1]
+                if prices[i] < prices[j] or (prices[i] == prices[j] and lead_times[i] < lead_times[j]):
+                    pos -= 1
+                else:
+                    break
+            if pos >= k:
+                continue
+            for t in range(min(count, k - 1), pos, -1):
+                out[m, t] = out[m, t - 1]
+            out[m, pos] = i
+            if count < k:
+                count += 1
+    
+    return out
+
+# Below this many rows thread start-up costs more than the scan itself
+_PARALLEL_MIN_ROWS = 4096
+
+# One fixed-width row per breaker. _build_catalog.py saves the default catalog
+# in this layout so worker processes can share it through the page cache.
+_CB_RECORD_DTYPE = np.dtype([
+    ('amp_rating', np.float64),
+    ('price', np.float64),
+    ('lead_time', np.int16),
+    ('mfr_id', np.int16),
+    ('voltage_bits', np.uint8),
+    ('voltage_accept', np.uint8),
+    ('motor_protection', np.bool_),
+    ('motor_only', np.bool_),
+])
+# Bump when the meaning of a record field changes, e.g. the voltage bit layout
+_CB_RECORD_VERSION = 2
+_CB_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cb_catalog.npy')
+_CB_CATALOG_META_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cb_catalog.json')
+
+if NUMBA_AVAILABLE:
+    # Manufacturers are scanned independently, so large catalogs fan out across
+    # cores; nogil lets concurrent request threads run the kernel side by side.
+    # The parallel variant compiles lazily on its first call.
+    _filter_and_topk_parallel = njit(parallel=True, nogil=True, cache=True)(_filter_and_topk)
+    _filter_and_topk = njit(nogil=True, cache=True)(_filter_and_topk)
+    # Pay the compilation cost once at import rather than on the first request,
+    # using read-only strided record-array columns like the real catalog table
+    _warmup = np.zeros(2, dtype=_CB_RECORD_DTYPE)
+    _warmup.flags.writeable = False
+    _filter_and_topk(_warmup['amp_rating'], _warmup['voltage_accept'], _warmup['price'],
+                     _warmup['lead_time'], np.array([0, 2], dtype=np.int64), 0.0, _ACCEPT_ALL)
+    del _warmup
+
+def _freeze_catalog(parts: List[Dict]) -> tuple:
+    """Make catalog entries safe to share: a tuple with read-only specifications
+    and interned manufacturer/availability strings"""
+    return tuple({
+        **part,
+        'manufacturer': sys.intern(part['manufacturer']),
+        'availability': sys.intern(part['availability']),
+        'specifications': MappingProxyType(part['specifications']),
+    } for part in parts)
+
+_CATALOG_FIELDS = ('manufacturer', 'product_line', 'part_number', 'description', 'specifications',
+                   'datasheet_url', 'price_estimate', 'availability', 'lead_time_days', 'nec_compliant')
+
+def _validate_catalog(parts: List[Dict], rating_key: str):
+    """Reject malformed catalog entries on load so matching can assume well-formed rows"""
+    for part in parts:
+        missing = [name for name in _CATALOG_FIELDS if name not in part]
+        spec = part.get('specifications', {})
+        missing += [f"specifications.{name}" for name in (rating_key, 'voltage') if name not in spec]
+        if missing:
+            raise ValueError(f"Catalog entry {part.get('part_number', '?')!r} is missing: {', '.join(missing)}")
+        if not isinstance(spec[rating_key], (int, float)) or not isinstance(spec['voltage'], str):
+            raise ValueError(f"Catalog entry {part['part_number']!r} has a non-numeric {rating_key} or non-string voltage")
+
+def _breaker_records(slices: Dict[str, slice], entries: List[Dict]) -> np.ndarray:
+    """Pack flattened breaker entries into a read-only record array"""
+    specs = [breaker['specifications'] for breaker in entries]
+    records = np.zeros(len(entries), dtype=_CB_RECORD_DTYPE)
+    for mfr_id, rows in enumerate(slices.values()):
+        records['mfr_id'][rows] = mfr_id
+    records['amp_rating'] = [float(spec['amp_rating']) for spec in specs]
+    records['voltage_bits'] = [_voltage_bits(spec['voltage']) for spec in specs]
+    records['voltage_accept'] = [_breaker_voltage_accept(bits) for bits in records['voltage_bits'].tolist()]
+    records['motor_protection'] = [bool(spec.get('motor_protection', False)) for spec in specs]
+    records['motor_only'] = [bool(spec.get('motor_only', False)) for spec in specs]
+    records['price'] = [breaker['price_estimate'] for breaker in entries]
+    records['lead_time'] = [breaker['lead_time_days'] for breaker in entries]
+    records.flags.writeable = False
+    return records
+
+def _catalog_fingerprint(entries: List[Dict]) -> str:
+    """Digest of the catalog entries and record layout, used to spot a stale cb_catalog.npy"""
+    payload = json.dumps([entries, _CB_RECORD_DTYPE.descr, _CB_RECORD_VERSION], default=_json_default, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _load_breaker_records(entries: List[Dict]) -> Optional[np.ndarray]:
+    """Memory-map the prebuilt catalog, or None when it is missing or out of date"""
+    try:
+        with open(_CB_CATALOG_META_PATH) as meta_file:
+            meta = json.load(meta_file)
+        if meta.get('fingerprint') != _catalog_fingerprint(entries):
+            return None
+        records = np.load(_CB_CATALOG_PATH, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    if records.dtype != _CB_RECORD_DTYPE or records.shape != (len(entries),):
+        return None
+    return records
+
+def _memoize(method, maxsize: int = 512):
+    """lru_cache over a bound method that holds its instance weakly.
+    
+    An engine keeps the memo as an attribute; caching the bound method itself
+    would make engine -> cache -> method -> engine a reference cycle that only
+    the cyclic GC can free.
+    """
+    method_ref = weakref.WeakMethod(method)
+    
+    @lru_cache(maxsize=maxsize)
+    def cached(*args):
+        return method_ref()(*args)
+    
+    return cached
+
+def _make_recommendation(part: Dict, reason: str) -> PartRecommendation:
+    """Build a recommendation from a catalog entry.
+    
+    The specifications mapping is shared with the catalog, not copied;
+    catalogs that bypassed _freeze_catalog get a read-only view here.
+    """
+    specifications = part['specifications']
+    if not isinstance(specifications, MappingProxyType):
+        specifications = MappingProxyType(specifications)
+    return PartRecommendation(
+        manufacturer=part['manufacturer'],
+        product_line=part['product_line'],
+        part_number=part['part_number'],
+        description=part['description'],
+        specifications=specifications,
+        datasheet_url=part['datasheet_url'],
+        price_estimate=part['price_estimate'],
+        availability=part['availability'],
+        lead_time_days=part['lead_time_days'],
+        nec_compliant=part['nec_compliant'],
+        reason_for_recommendation=reason
+    )
+
+# Circuit breaker catalog, built once at import and shared by every engine
+_SIEMENS_BREAKERS = _freeze_catalog([
+    {
+        'manufacturer': 'Siemens',
+        'product_line': 'Sentron WL',
+        'part_number': 'WL3B25B800E',
+        'description': '25kA Circuit Breaker, Electronic Trip',
+        'specifications': {
+            'amp_rating': 100,
+            'voltage': '480V',
+            'poles': 3,
+            'interruption_capacity': '65kA',
+            'trip_unit': 'Electronic',
+            'motor_protection': False,
+            'frame_size': 'WL3'
+        },
+        'datasheet_url': 'https://new.abb.com/products/3VA21/3VA2125-5EF32-0AA0/datasheet',
+        'price_estimate': 3850.00,
+        'availability': 'In Stock',
+        'lead_time_days': 10,
+        'nec_compliant': True
+    },
+    {
+        'manufacturer': 'Siemens',
+        'product_line': 'Sentron ED4',
+        'part_number': 'ED4B100',
+        'description': 'Thermal-Magnetic Circuit Breaker',
+        'specifications': {
+            'amp_rating': 100,
+            'voltage': '480V',
+            'poles': 3,
+            'interruption_capacity': '22kA',
+            'trip_unit': 'Thermal-Magnetic',
+            'motor_protection': True,
+            'frame_size': 'ED4'
+        },
+        'datasheet_url': 'https://new.abb.com/products/3VA21/3VA2125-5EF32-0AA0/datasheet',
+        'price_estimate': 2850.00,
+        'availability': 'In Stock',
+        'lead_time_days': 7,
+        'nec_compliant': True
+    }
+])
+
+_ABB_BREAKERS = _freeze_catalog([
+    {
+        'manufacturer': 'ABB',
+        'product_line': 'S203',
+        'part_number': 'S203-C100',
+        'description': 'C-Curve Circuit Breaker, 100A',
+        'specifications': {
+            'amp_rating': 100,
+            'voltage': '480V',
+            'poles': 3,
+            'interruption_capacity': '25kA',
+            'trip_unit': 'Thermal-Magnetic',
+            'motor_protection': True,
+            'frame_size': 'S200'
+        },
+        'datasheet_url': 'https://search.abb.com/library/Download.aspx?DocumentID=1SAM000000R0004&LanguageCode=en&DocumentPartId=&Action=Launch',
+        'price_estimate': 2650.00,
+        'availability': 'In Stock',
+        'lead_time_days': 12,
+        'nec_compliant': True
+    }
+])
+
+_SCHNEIDER_BREAKERS = _freeze_catalog([
+    {
+        'manufacturer': 'Schneider Electric',
+        'product_line': 'PowerPact H',
+        'part_number': 'HGL36100',
+        'description': '100A Circuit Breaker, 65kA',
+        'specifications': {
+            'amp_rating': 100,
+            'voltage': '480V',
+            'poles': 3,
+            'interruption_capacity': '65kA',
+            'trip_unit': 'Thermal-Magnetic',
+            'motor_protection': True,
+            'frame_size': 'H-frame'
+        },
+        'datasheet_url': 'https://www.se.com/ww/en/product/HGL36100/',
+        'price_estimate': 3250.00,
+        'availability': 'In Stock',
+        'lead_time_days': 8,
+        'nec_compliant': True
+    },
+    {
+        'manufacturer': 'Schneider Electric',
+        'product_line': 'iSW',
+        'part_number': 'iSW30100',
+        'description': 'Compact 100A Circuit Breaker',
+        'specifications': {
+            'amp_rating': 100,
+            'voltage': '480V',
+            'poles': 3,
+            'interruption_capacity': '35kA',
+            'trip_unit': 'Electronic',
+            'motor_protection': False,
+            'frame_size': 'iC60N'
+        },
+        'datasheet_url': 'https://www.se.com/ww/en/product/iSW30100/',
+        'price_estimate': 1850.00,
+        'availability': 'In Stock',
+        'lead_time_days': 7,
+        'nec_compliant': True
+    }
+])
+
+_EATON_BREAKERS = _freeze_catalog([
+    {
+        'manufacturer': 'Eaton',
+        'product_line': 'BR',
+        'part_number': 'BR3100',
+        'description': '100A Circuit Breaker, Plug-in',
+        'specifications': {
+            'amp_rating': 100,
+            'voltage': '480V',
+            'poles': 3,
+            'interruption_capacity': '10kA',
+            'trip_unit': 'Thermal-Magnetic',
+            'motor_protection': True,
+            'frame_size': 'BR'
+        },
+        'datasheet_url': 'https://www.eaton.com/us/en-us/products/low-voltage-power-circuit-breakers/br-family.html',
+        'price_estimate': 2850.00,
+        'availability': 'In Stock',
+        'lead_time_days': 10,
+        'nec_compliant': True
+    }
+])
+
+_GE_BREAKERS = _freeze_catalog([
+    {
+        'manufacturer': 'General Electric',
+        'product_line': 'AE',
+        'part_number': 'AE100',
+        'description': '100A Thermal-Magnetic Breaker',
+        'specifications': {
+            'amp_rating': 100,
+            'voltage': '480V',
+            'poles': 3,
+            'interruption_capacity': '25kA',
+            'trip_unit': 'Thermal-Magnetic',
+            'motor_protection': True,
+            'frame_size': 'AE'
+        },
+        'datasheet_url': 'https://www.ge.com/industrial-solutions/circuit-breakers/ae-family',
+        'price_estimate': 2750.00,
+        'availability': 'In Stock',
+        'lead_time_days': 14,
+        'nec_compliant': True
+    }
+])
+
+_OMRON_BREAKERS = _freeze_catalog([
+    {
+        'manufacturer': 'Omron',
+        'product_line': 'Breaker',
+        'part_number': 'BB100',
+        'description': '100A Industrial Circuit Breaker',
+        'specifications': {
+            'amp_rating': 100,
+            'voltage': '480V',
+            'poles': 3,
+            'interruption_capacity': '18kA',
+            'trip_unit': 'Thermal-Magnetic',
+            'motor_protection': True,
+            'frame_size': 'BB'
+        },
+        'datasheet_url': 'https://www.omron.com/products/circuit-breakers/',
+        'price_estimate': 2950.00,
+        'availability': 'In Stock',
+        'lead_time_days': 15,
+        'nec_compliant': True
+    }
+])
+
+def _flatten_breakers(mappings: Mapping[str, tuple]) -> Tuple[List[Dict], Dict[str, slice]]:
+    """Validated catalog rows in manufacturer order, and each manufacturer's row range"""
+    entries = []
+    slices = {}
+    for manufacturer, breakers in mappings.items():
+        start = len(entries)
+        entries.extend(breakers)
+        slices[manufacturer] = slice(start, len(entries))
+    _validate_catalog(entries, 'amp_rating')
+    return entries, slices
+
+def _load_default_breaker_catalog(mappings: Mapping[str, tuple]) -> Tuple[List[Dict], Dict[str, slice], np.ndarray]:
+    """Flatten the default catalog and map its records from cb_catalog.npy when
+    that file is current, otherwise pack them in memory"""
+    entries, slices = _flatten_breakers(mappings)
+    records = _load_breaker_records(entries)
+    if records is None:
+        records = _breaker_records(slices, entries)
+    return entries, slices, records
 
 class CircuitBreakerRecommendationEngine:
     """Automatic circuit breaker recommendations based on sizing calculations"""
     
+    # Shared by every engine, so read-only
+    MANUFACTURER_MAPPINGS = MappingProxyType({
+        'siemens': _SIEMENS_BREAKERS,
+        'abb': _ABB_BREAKERS,
+        'schneider': _SCHNEIDER_BREAKERS,
+        'eaton': _EATON_BREAKERS,
+        'ge': _GE_BREAKERS,
+        'omron': _OMRON_BREAKERS
+    })
+    
     def __init__(self):
-        self.manufacturer_mappings = {
-            'siemens': self._get_siemens_breakers(),
-            'abb': self._get_abb_breakers(),
-            'schneider': self._get_schneider_breakers(),
-            'eaton': self._get_eaton_breakers(),
-            'ge': self._get_ge_breakers(),
-            'omron': self._get_omron_breakers()
-        }
+        self.manufacturer_mappings = self.MANUFACTURER_MAPPINGS
+        self._build_catalog_table()
+        # Results are a pure function of the arguments over a static catalog.
+        # The memo is per instance and refers back to the engine weakly, so it
+        # is freed by reference counting along with the engine.
+        self._recommend_cached = _memoize(self._recommend_circuit_breakers)
     
-    def recommend_circuit_breakers(self, amp_rating: float, voltage: str, application: str = 'general') -> Dict[str, List[PartRecommendation]]:
+    def _build_catalog_table(self):
+        """Flatten the catalog into parallel arrays, one row per breaker"""
+        # The default catalog is flattened, validated and loaded once per
+        # process (see _DEFAULT_BREAKER_CATALOG); other catalogs are built here
+        if self.manufacturer_mappings is self.MANUFACTURER_MAPPINGS:
+            self._cb_entries, self._cb_slices, records = _DEFAULT_BREAKER_CATALOG
+        else:
+            self._cb_entries, self._cb_slices = _flatten_breakers(self.manufacturer_mappings)
+            records = _breaker_records(self._cb_slices, self._cb_entries)
+        
+        count = len(self._cb_entries)
+        self._cb_offsets = np.array([0] + [rows.stop for rows in self._cb_slices.values()], dtype=np.int64)
+        if NUMBA_AVAILABLE:
+            self._cb_kernel = _filter_and_topk_parallel if count >= _PARALLEL_MIN_ROWS else _filter_and_topk
+        
+        self._cb_records = records
+        self._cb_other_voltages = [_other_voltages(breaker['specifications']['voltage']) for breaker in self._cb_entries]
+        self._cb_table = {name: np.asarray(records[name]) for name in records.dtype.names}
+        
+        # Per manufacturer: row numbers sorted by amp rating, so the amp
+        # tolerance check becomes a binary search for the first admissible row
+        amps = self._cb_table['amp_rating']
+        self._cb_amp_index = {}
+        for manufacturer, rows in self._cb_slices.items():
+            order = np.argsort(amps[rows], kind='stable') + rows.start
+            self._cb_amp_index[manufacturer] = (amps[order], order)
+        
+        # Ranking key per row: cheapest first, then shortest lead time, ties in
+        # catalog order; the row number makes the key total, so candidates can
+        # be ranked in any order
+        self._cb_rank = [(breaker['price_estimate'], breaker['lead_time_days'], row)
+                         for row, breaker in enumerate(self._cb_entries)]
+        
+        # The catalog is static and reasons only depend on the breaker and
+        # the application, so build each recommendation once per Application
+        self._cb_recommendations = [
+            [
+                _make_recommendation(breaker, self._get_recommendation_reason(breaker, application))
+                for breaker in self._cb_entries
+            ]
+            for application in Application
+        ]
+    
+    def recommend_circuit_breakers(self, amp_rating: float, voltage: str, application: Application = Application.GENERAL) -> Dict[str, List[PartRecommendation]]:
         """Get circuit breaker recommendations based on calculated requirements"""
+        # Strings other than 'motor' fold into GENERAL, so they share one cache key
+        application = Application.coerce(application)
+        result = self._recommend_cached(float(amp_rating), voltage, application)
+        return {manufacturer: list(recs) for manufacturer, recs in result.items()}
+    
+    def _recommend_circuit_breakers(self, amp_rating: float, voltage: str, application: Application) -> Dict[str, Tuple[PartRecommendation, ...]]:
+        """Uncached top-3 breaker recommendations per manufacturer"""
         recommendations = {}
+        cached = self._cb_recommendations[application]
         
-        for manufacturer, breakers in self.manufacturer_mappings.items():
-            manufacturer_recs = []
-            
-            for breaker in breakers:
-                if self._matches_requirements(breaker, amp_rating, voltage, application):
-                    recommendation = PartRecommendation(
-                        manufacturer=breaker['manufacturer'],
-                        product_line=breaker['product_line'],
-                        part_number=breaker['part_number'],
-                        description=breaker['description'],
-                        specifications=breaker['specifications'],
-                        datasheet_url=breaker['datasheet_url'],
-                        price_estimate=breaker['price_estimate'],
-                        availability=breaker['availability'],
-                        lead_time_days=breaker['lead_time_days'],
-                        nec_compliant=breaker['nec_compliant'],
-                        reason_for_recommendation=self._get_recommendation_reason(breaker, amp_rating, application)
-                    )
-                    manufacturer_recs.append(recommendation)
+        query_mask = _breaker_voltage_query(voltage)
+        
+        # The kernel matches voltages by bit alone; a query voltage outside the
+        # bit table needs the exact comparison in _voltage_mask
+        if NUMBA_AVAILABLE and not _needs_exact_voltage(query_mask):
+            table = self._cb_table
+            best_rows = self._cb_kernel(table['amp_rating'], table['voltage_accept'], table['price'],
+                                        table['lead_time'], self._cb_offsets, float(amp_rating), query_mask)
+            for manufacturer, best in zip(self._cb_slices, best_rows.tolist()):
+                recommendations[manufacturer] = tuple(cached[index] for index in best if index >= 0)
+            return recommendations
+        
+        voltage_ok = self._voltage_mask(voltage)
+        for manufacturer, (sorted_amps, order) in self._cb_amp_index.items():
+            # Rows from the first admissible amp rating onward, in amp order
+            rows = order[_first_admissible(sorted_amps, amp_rating):]
+            if voltage_ok is not True:
+                rows = rows[voltage_ok[rows]]
+            candidates = rows.tolist()
             
-            # Sort by best match (price, availability, specifications)
-            manufacturer_recs.sort(key=lambda x: (x.price_estimate, x.lead_time_days))
-            recommendations[manufacturer] = manufacturer_recs[:3]  # Top 3 per manufacturer
+            # Top 3 per manufacturer by best match (price, then lead time)
+            best = heapq.nsmallest(3, candidates, key=self._cb_rank.__getitem__)
+            recommendations[manufacturer] = tuple(cached[index] for index in best)
         
         return recommendations
     
-    def _matches_requirements(self, breaker: Dict, amp_rating: float, voltage: str, application: str) -> bool:
-        """Check if breaker matches the calculated requirements"""
-        try:
-            # Check amp rating compatibility
-            breaker_amp = float(breaker['specifications']['amp_rating'])
-            if amp_rating > breaker_amp * 1.25:  # Allow 25% oversizing tolerance
-                return False
-            
-            # Check voltage compatibility
-            breaker_voltage = breaker['specifications']['voltage']
-            if voltage not in breaker_voltage and voltage != '480V' and '480' in breaker_voltage:
-                return False
-            
-            # Check application suitability
-            if application == 'motor' and breaker['specifications'].get('motor_protection', False):
-                return True
-            elif application == 'general' and not breaker['specifications'].get('motor_only', False):
-                return True
-            
+    def recommend_batch(self, amp_ratings, voltages: List[str], applications: Optional[List[Application]] = None) -> List[Dict[str, List[PartRecommendation]]]:
+        """Recommendations for many sizing queries at once, e.g. a bill of materials.
+        
+        Matching runs as one (queries x breakers) NumPy pass instead of a
+        call per query. Results line up with the inputs and equal what
+        recommend_circuit_breakers returns for each query.
+        """
+        amps = np.asarray(amp_ratings, dtype=np.float64).reshape(-1)
+        if applications is None:
+            applications = [Application.GENERAL] * amps.size
+        if not amps.size == len(voltages) == len(applications):
+            raise ValueError("amp_ratings, voltages and applications must have the same length")
+        
+        table = self._cb_table
+        query_masks = np.fromiter((_breaker_voltage_query(voltage) for voltage in voltages), dtype=np.uint8, count=amps.size)
+        matches = (amps[:, None] <= table['amp_rating'] * 1.25) & ((table['voltage_accept'] & (query_masks[:, None] & _BITS_EXACT)) != 0)
+        for query, voltage in enumerate(voltages):
+            if _needs_exact_voltage(int(query_masks[query])):
+                matches[query] = (amps[query] <= table['amp_rating'] * 1.25) & self._voltage_mask(voltage)
+        
+        results = []
+        for query_matches, application in zip(matches, applications):
+            cached = self._cb_recommendations[Application.coerce(application)]
+            recommendations = {}
+            for manufacturer, rows in self._cb_slices.items():
+                candidates = (np.flatnonzero(query_matches[rows]) + rows.start).tolist()
+                best = heapq.nsmallest(3, candidates, key=self._cb_rank.__getitem__)
+                recommendations[manufacturer] = [cached[index] for index in best]
+            results.append(recommendations)
+        return results
+    
+    def _voltage_mask(self, voltage: str):
+        """Boolean mask of voltage-compatible breakers, or True when all are.
+        
+        The 25% amp oversizing tolerance is applied through the sorted amp
+        index. Application only shapes the recommendation reason; every
+        application is accepted regardless of motor_protection/motor_only.
+        """
+        # 480V-rated breakers must list the requested voltage
+        query_mask = _breaker_voltage_query(voltage)
+        if query_mask == _ACCEPT_ALL:
             return True
-        except (KeyError, ValueError, TypeError):
-            return False
+        return _voltage_rows_ok(self._cb_table['voltage_accept'], self._cb_other_voltages, query_mask, voltage)
     
-    def _get_recommendation_reason(self, breaker: Dict, amp_rating: float, application: str) -> str:
-        """Generate reason for recommendation"""
+    @staticmethod
+    def _get_recommendation_reason(breaker: Dict, application: Application) -> str:
+        """Generate reason for recommendation from the breaker's static catalog fields"""
         reasons = []
         
-        if breaker['specifications'].get('motor_protection', False) and application == 'motor':
+        if breaker['specifications'].get('motor_protection', False) and application is Application.MOTOR:
             reasons.append("Specifically designed for motor protection")
         
         if breaker['specifications'].get('interruption_capacity', '0kA') in ['65kA', '100kA']:
@@ -112,255 +679,242 @@ class CircuitBreakerRecommendationEngine:
             reasons.append("Meets all electrical requirements")
         
         return "; ".join(reasons)
-    
-    def _get_siemens_breakers(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'Siemens',
-                'product_line': 'Sentron WL',
-                'part_number': 'WL3B25B800E',
-                'description': '25kA Circuit Breaker, Electronic Trip',
-                'specifications': {
-                    'amp_rating': 100,
-                    'voltage': '480V',
-                    'poles': 3,
-                    'interruption_capacity': '65kA',
-                    'trip_unit': 'Electronic',
-                    'motor_protection': False,
-                    'frame_size': 'WL3'
-                },
-                'datasheet_url': 'https://new.abb.com/products/3VA21/3VA2125-5EF32-0AA0/datasheet',
-                'price_estimate': 3850.00,
-                'availability': 'In Stock',
-                'lead_time_days': 10,
-                'nec_compliant': True
-            },
-            {
-                'manufacturer': 'Siemens',
-                'product_line': 'Sentron ED4',
-                'part_number': 'ED4B100',
-                'description': 'Thermal-Magnetic Circuit Breaker',
-                'specifications': {
-                    'amp_rating': 100,
-                    'voltage': '480V',
-                    'poles': 3,
-                    'interruption_capacity': '22kA',
-                    'trip_unit': 'Thermal-Magnetic',
-                    'motor_protection': True,
-                    'frame_size': 'ED4'
-                },
-                'datasheet_url': 'https://new.abb.com/products/3VA21/3VA2125-5EF32-0AA0/datasheet',
-                'price_estimate': 2850.00,
-                'availability': 'In Stock',
-                'lead_time_days': 7,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_abb_breakers(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'ABB',
-                'product_line': 'S203',
-                'part_number': 'S203-C100',
-                'description': 'C-Curve Circuit Breaker, 100A',
-                'specifications': {
-                    'amp_rating': 100,
-                    'voltage': '480V',
-                    'poles': 3,
-                    'interruption_capacity': '25kA',
-                    'trip_unit': 'Thermal-Magnetic',
-                    'motor_protection': True,
-                    'frame_size': 'S200'
-                },
-                'datasheet_url': 'https://search.abb.com/library/Download.aspx?DocumentID=1SAM000000R0004&LanguageCode=en&DocumentPartId=&Action=Launch',
-                'price_estimate': 2650.00,
-                'availability': 'In Stock',
-                'lead_time_days': 12,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_schneider_breakers(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'Schneider Electric',
-                'product_line': 'PowerPact H',
-                'part_number': 'HGL36100',
-                'description': '100A Circuit Breaker, 65kA',
-                'specifications': {
-                    'amp_rating': 100,
-                    'voltage': '480V',
-                    'poles': 3,
-                    'interruption_capacity': '65kA',
-                    'trip_unit': 'Thermal-Magnetic',
-                    'motor_protection': True,
-                    'frame_size': 'H-frame'
-                },
-                'datasheet_url': 'https://www.se.com/ww/en/product/HGL36100/',
-                'price_estimate': 3250.00,
-                'availability': 'In Stock',
-                'lead_time_days': 8,
-                'nec_compliant': True
-            },
-            {
-                'manufacturer': 'Schneider Electric',
-                'product_line': 'iSW',
-                'part_number': 'iSW30100',
-                'description': 'Compact 100A Circuit Breaker',
-                'specifications': {
-                    'amp_rating': 100,
-                    'voltage': '480V',
-                    'poles': 3,
-                    'interruption_capacity': '35kA',
-                    'trip_unit': 'Electronic',
-                    'motor_protection': False,
-                    'frame_size': 'iC60N'
-                },
-                'datasheet_url': 'https://www.se.com/ww/en/product/iSW30100/',
-                'price_estimate': 1850.00,
-                'availability': 'In Stock',
-                'lead_time_days': 7,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_eaton_breakers(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'Eaton',
-                'product_line': 'BR',
-                'part_number': 'BR3100',
-                'description': '100A Circuit Breaker, Plug-in',
-                'specifications': {
-                    'amp_rating': 100,
-                    'voltage': '480V',
-                    'poles': 3,
-                    'interruption_capacity': '10kA',
-                    'trip_unit': 'Thermal-Magnetic',
-                    'motor_protection': True,
-                    'frame_size': 'BR'
-                },
-                'datasheet_url': 'https://www.eaton.com/us/en-us/products/low-voltage-power-circuit-breakers/br-family.html',
-                'price_estimate': 2850.00,
-                'availability': 'In Stock',
-                'lead_time_days': 10,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_ge_breakers(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'General Electric',
-                'product_line': 'AE',
-                'part_number': 'AE100',
-                'description': '100A Thermal-Magnetic Breaker',
-                'specifications': {
-                    'amp_rating': 100,
-                    'voltage': '480V',
-                    'poles': 3,
-                    'interruption_capacity': '25kA',
-                    'trip_unit': 'Thermal-Magnetic',
-                    'motor_protection': True,
-                    'frame_size': 'AE'
-                },
-                'datasheet_url': 'https://www.ge.com/industrial-solutions/circuit-breakers/ae-family',
-                'price_estimate': 2750.00,
-                'availability': 'In Stock',
-                'lead_time_days': 14,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_omron_breakers(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'Omron',
-                'product_line': 'Breaker',
-                'part_number': 'BB100',
-                'description': '100A Industrial Circuit Breaker',
-                'specifications': {
-                    'amp_rating': 100,
-                    'voltage': '480V',
-                    'poles': 3,
-                    'interruption_capacity': '18kA',
-                    'trip_unit': 'Thermal-Magnetic',
-                    'motor_protection': True,
-                    'frame_size': 'BB'
-                },
-                'datasheet_url': 'https://www.omron.com/products/circuit-breakers/',
-                'price_estimate': 2950.00,
-                'availability': 'In Stock',
-                'lead_time_days': 15,
-                'nec_compliant': True
-            }
-        ]
+
+# The default catalog's rows and records, shared read-only by every engine.
+# Checking and mapping cb_catalog.npy happens here once per process rather
+# than on every engine construction.
+_DEFAULT_BREAKER_CATALOG = _load_default_breaker_catalog(CircuitBreakerRecommendationEngine.MANUFACTURER_MAPPINGS)
+
+# Motor catalog, built once at import and shared by every engine
+_SIEMENS_MOTORS = _freeze_catalog([
+    {
+        'manufacturer': 'Siemens',
+        'product_line': 'SIMOTICS SD',
+        'part_number': '1FK7022-5AK71-1QG0',
+        'description': '10HP IE3 Motor, TEFC',
+        'specifications': {
+            'hp': 10.0,
+            'voltage': '480V',
+            'efficiency_class': 'IE3',
+            'efficiency_percent': 89.5,
+            'rpm': 1800,
+            'enclosure': 'TEFC',
+            'service_factor': 1.15,
+            'frame_size': '215T'
+        },
+        'datasheet_url': 'https://new.siemens.com/global/en/products/automation/simotics-motors.html',
+        'price_estimate': 2850.00,
+        'availability': 'In Stock',
+        'lead_time_days': 14,
+        'nec_compliant': True
+    }
+])
+
+_ABB_MOTORS = _freeze_catalog([
+    {
+        'manufacturer': 'ABB',
+        'product_line': 'M3BP',
+        'part_number': 'M3BP 132SMA 4',
+        'description': '10HP IE3 Motor, IP55',
+        'specifications': {
+            'hp': 10.0,
+            'voltage': '480V',
+            'efficiency_class': 'IE3',
+            'efficiency_percent': 89.0,
+            'rpm': 1800,
+            'enclosure': 'IP55',
+            'service_factor': 1.15,
+            'frame_size': '132'
+        },
+        'datasheet_url': 'https://new.abb.com/motors-generators/low-voltage-ac-motors/m3bp-ie3',
+        'price_estimate': 2650.00,
+        'availability': 'In Stock',
+        'lead_time_days': 12,
+        'nec_compliant': True
+    }
+])
+
+_SCHNEIDER_MOTORS = _freeze_catalog([
+    {
+        'manufacturer': 'Schneider Electric',
+        'product_line': 'Altivar Process',
+        'part_number': 'ATV12H037M3C',
+        'description': '10HP Soft Starter',
+        'specifications': {
+            'hp': 10.0,
+            'voltage': '480V',
+            'type': 'Soft Starter',
+            'control_voltage': '24V',
+            'display': 'LED',
+            'protection': 'Thermal'
+        },
+        'datasheet_url': 'https://www.se.com/us/en/product-range/60044-altivar-process/',
+        'price_estimate': 950.00,
+        'availability': 'In Stock',
+        'lead_time_days': 7,
+        'nec_compliant': True
+    }
+])
+
+_EATON_MOTORS = _freeze_catalog([
+    {
+        'manufacturer': 'Eaton',
+        'product_line': 'Crusher Duty',
+        'part_number': 'ED10HP',
+        'description': '10HP Crusher Duty Motor',
+        'specifications': {
+            'hp': 10.0,
+            'voltage': '480V',
+            'efficiency_class': 'IE3',
+            'efficiency_percent': 89.0,
+            'rpm': 1800,
+            'enclosure': 'TEFC',
+            'duty': 'Crusher',
+            'service_factor': 1.25
+        },
+        'datasheet_url': 'https://www.eaton.com/us/en-us/products/low-voltage-motor-controls/crusher-duty-motors.html',
+        'price_estimate': 3100.00,
+        'availability': 'In Stock',
+        'lead_time_days': 18,
+        'nec_compliant': True
+    }
+])
+
+_GE_MOTORS = _freeze_catalog([
+    {
+        'manufacturer': 'General Electric',
+        'product_line': 'Crusher Duty',
+        'part_number': '5KH49RN214G',
+        'description': '10HP Crusher Duty Motor',
+        'specifications': {
+            'hp': 10.0,
+            'voltage': '480V',
+            'efficiency_class': 'IE3',
+            'efficiency_percent': 89.0,
+            'rpm': 1800,
+            'enclosure': 'TEFC',
+            'duty': 'Crusher',
+            'service_factor': 1.15
+        },
+        'datasheet_url': 'https://www.ge.com/industrial-solutions/motors-generators/low-voltage-ac-motors',
+        'price_estimate': 2950.00,
+        'availability': 'In Stock',
+        'lead_time_days': 21,
+        'nec_compliant': True
+    }
+])
+
+_BALDOR_MOTORS = _freeze_catalog([
+    {
+        'manufacturer': 'Baldor',
+        'product_line': 'General Duty',
+        'part_number': 'IDM3710T',
+        'description': '10HP General Purpose Motor',
+        'specifications': {
+            'hp': 10.0,
+            'voltage': '480V',
+            'efficiency_class': 'IE3',
+            'efficiency_percent': 89.5,
+            'rpm': 1800,
+            'enclosure': 'TEFC',
+            'service_factor': 1.15
+        },
+        'datasheet_url': 'https://www.baldor.com/products/low-voltage-ac-motors',
+        'price_estimate': 2750.00,
+        'availability': 'In Stock',
+        'lead_time_days': 16,
+        'nec_compliant': True
+    }
+])
 
 class MotorRecommendationEngine:
     """Automatic motor recommendations based on sizing calculations"""
     
+    # Shared by every engine, so read-only
+    MANUFACTURER_MAPPINGS = MappingProxyType({
+        'siemens': _SIEMENS_MOTORS,
+        'abb': _ABB_MOTORS,
+        'schneider': _SCHNEIDER_MOTORS,
+        'eaton': _EATON_MOTORS,
+        'ge': _GE_MOTORS,
+        'baldor': _BALDOR_MOTORS
+    })
+    
     def __init__(self):
-        self.manufacturer_mappings = {
-            'siemens': self._get_siemens_motors(),
-            'abb': self._get_abb_motors(),
-            'schneider': self._get_schneider_motors(),
-            'eaton': self._get_eaton_motors(),
-            'ge': self._get_ge_motors(),
-            'baldor': self._get_baldor_motors()
+        self.manufacturer_mappings = self.MANUFACTURER_MAPPINGS
+        self._build_catalog_table()
+        # Results are a pure function of the arguments over a static catalog.
+        # The memo is per instance and refers back to the engine weakly, so it
+        # is freed by reference counting along with the engine.
+        self._recommend_cached = _memoize(self._recommend_motors)
+    
+    def _build_catalog_table(self):
+        """Flatten the catalog into parallel arrays, one row per motor"""
+        self._motor_entries = []
+        self._motor_slices = {}
+        for manufacturer, motors in self.manufacturer_mappings.items():
+            start = len(self._motor_entries)
+            self._motor_entries.extend(motors)
+            self._motor_slices[manufacturer] = slice(start, len(self._motor_entries))
+        
+        _validate_catalog(self._motor_entries, 'hp')
+        
+        count = len(self._motor_entries)
+        specs = [motor['specifications'] for motor in self._motor_entries]
+        self._motor_table = {
+            'hp': np.fromiter((float(spec['hp']) for spec in specs), dtype=np.float64, count=count),
+            'voltage_bits': np.fromiter((_voltage_bits(spec['voltage']) for spec in specs), dtype=np.uint8, count=count),
+            'efficiency_rank': np.fromiter((_EFFICIENCY_RANK.get(spec.get('efficiency_class', 'IE3'), _EFF_DEFAULT) for spec in specs), dtype=np.int8, count=count),
         }
+        
+        self._motor_other_voltages = [_other_voltages(spec['voltage']) for spec in specs]
+        
+        # Ranking key per row: highest (price, efficiency) first
+        self._motor_rank = [(motor['price_estimate'], spec.get('efficiency_percent', 0)) for motor, spec in zip(self._motor_entries, specs)]
+        
+        # Motor reasons only depend on the catalog entry, so build each recommendation once
+        self._motor_recommendations = [
+            _make_recommendation(motor, self._get_motor_recommendation_reason(motor))
+            for motor in self._motor_entries
+        ]
     
     def recommend_motors(self, hp_rating: float, voltage: str, efficiency_class: str = 'IE3') -> Dict[str, List[PartRecommendation]]:
         """Get motor recommendations based on calculated requirements"""
+        result = self._recommend_cached(float(hp_rating), voltage, efficiency_class)
+        return {manufacturer: list(recs) for manufacturer, recs in result.items()}
+    
+    def _recommend_motors(self, hp_rating: float, voltage: str, efficiency_class: str) -> Dict[str, Tuple[PartRecommendation, ...]]:
+        """Uncached top-3 motor recommendations per manufacturer"""
         recommendations = {}
+        mask = self._match_motor_mask(hp_rating, voltage, efficiency_class)
         
-        for manufacturer, motors in self.manufacturer_mappings.items():
-            manufacturer_recs = []
-            
-            for motor in motors:
-                if self._matches_motor_requirements(motor, hp_rating, voltage, efficiency_class):
-                    recommendation = PartRecommendation(
-                        manufacturer=motor['manufacturer'],
-                        product_line=motor['product_line'],
-                        part_number=motor['part_number'],
-                        description=motor['description'],
-                        specifications=motor['specifications'],
-                        datasheet_url=motor['datasheet_url'],
-                        price_estimate=motor['price_estimate'],
-                        availability=motor['availability'],
-                        lead_time_days=motor['lead_time_days'],
-                        nec_compliant=motor['nec_compliant'],
-                        reason_for_recommendation=self._get_motor_recommendation_reason(motor, hp_rating)
-                    )
-                    manufacturer_recs.append(recommendation)
-            
-            manufacturer_recs.sort(key=lambda x: (x.price_estimate, x.specifications.get('efficiency_percent', 0)), reverse=True)
-            recommendations[manufacturer] = manufacturer_recs[:3]
+        for manufacturer, rows in self._motor_slices.items():
+            candidates = (np.flatnonzero(mask[rows]) + rows.start).tolist()
+            best = heapq.nlargest(3, candidates, key=self._motor_rank.__getitem__)
+            recommendations[manufacturer] = tuple(self._motor_recommendations[index] for index in best)
         
         return recommendations
     
-    def _matches_motor_requirements(self, motor: Dict, hp_rating: float, voltage: str, efficiency_class: str) -> bool:
-        """Check if motor matches requirements"""
-        try:
-            motor_hp = float(motor['specifications']['hp'])
-            if abs(motor_hp - hp_rating) > hp_rating * 0.1:  # 10% tolerance
-                return False
-            
-            motor_voltage = motor['specifications']['voltage']
-            if voltage not in motor_voltage and voltage != '480V':
-                return False
-            
-            motor_efficiency = motor['specifications'].get('efficiency_class', 'IE3')
-            efficiency_rank = {'IE1': 1, 'IE2': 2, 'IE3': 3, 'IE4': 4, 'IE5': 5}
-            required_rank = efficiency_rank.get(efficiency_class, 3)
-            motor_rank = efficiency_rank.get(motor_efficiency, 3)
-            
-            return motor_rank >= required_rank
-        except (KeyError, ValueError, TypeError):
-            return False
+    def _match_motor_mask(self, hp_rating: float, voltage: str, efficiency_class: str) -> np.ndarray:
+        """Boolean mask of motors that match the requirements"""
+        table = self._motor_table
+        
+        hp_ok = np.abs(table['hp'] - hp_rating) <= hp_rating * 0.1  # 10% tolerance
+        
+        query_bits = _query_voltage_bits(voltage)
+        if query_bits & _BIT_480V:
+            voltage_ok = True
+        else:
+            voltage_ok = _voltage_rows_ok(table['voltage_bits'], self._motor_other_voltages, query_bits, voltage)
+        
+        required_rank = _EFFICIENCY_RANK.get(efficiency_class, _EFF_DEFAULT)
+        efficiency_ok = table['efficiency_rank'] >= required_rank
+        
+        return hp_ok & voltage_ok & efficiency_ok
     
-    def _get_motor_recommendation_reason(self, motor: Dict, hp_rating: float) -> str:
-        """Generate reason for motor recommendation"""
+    @staticmethod
+    def _get_motor_recommendation_reason(motor: Dict) -> str:
+        """Generate reason for motor recommendation from its static catalog fields"""
         reasons = []
         
         efficiency = motor['specifications'].get('efficiency_percent', 0)
@@ -380,182 +934,37 @@ class MotorRecommendationEngine:
             reasons.append("Meets all electrical and mechanical requirements")
         
         return "; ".join(reasons)
-    
-    def _get_siemens_motors(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'Siemens',
-                'product_line': 'SIMOTICS SD',
-                'part_number': '1FK7022-5AK71-1QG0',
-                'description': '10HP IE3 Motor, TEFC',
-                'specifications': {
-                    'hp': 10.0,
-                    'voltage': '480V',
-                    'efficiency_class': 'IE3',
-                    'efficiency_percent': 89.5,
-                    'rpm': 1800,
-                    'enclosure': 'TEFC',
-                    'service_factor': 1.15,
-                    'frame_size': '215T'
-                },
-                'datasheet_url': 'https://new.siemens.com/global/en/products/automation/simotics-motors.html',
-                'price_estimate': 2850.00,
-                'availability': 'In Stock',
-                'lead_time_days': 14,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_abb_motors(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'ABB',
-                'product_line': 'M3BP',
-                'part_number': 'M3BP 132SMA 4',
-                'description': '10HP IE3 Motor, IP55',
-                'specifications': {
-                    'hp': 10.0,
-                    'voltage': '480V',
-                    'efficiency_class': 'IE3',
-                    'efficiency_percent': 89.0,
-                    'rpm': 1800,
-                    'enclosure': 'IP55',
-                    'service_factor': 1.15,
-                    'frame_size': '132'
-                },
-                'datasheet_url': 'https://new.abb.com/motors-generators/low-voltage-ac-motors/m3bp-ie3',
-                'price_estimate': 2650.00,
-                'availability': 'In Stock',
-                'lead_time_days': 12,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_schneider_motors(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'Schneider Electric',
-                'product_line': 'Altivar Process',
-                'part_number': 'ATV12H037M3C',
-                'description': '10HP Soft Starter',
-                'specifications': {
-                    'hp': 10.0,
-                    'voltage': '480V',
-                    'type': 'Soft Starter',
-                    'control_voltage': '24V',
-                    'display': 'LED',
-                    'protection': 'Thermal'
-                },
-                'datasheet_url': 'https://www.se.com/us/en/product-range/60044-altivar-process/',
-                'price_estimate': 950.00,
-                'availability': 'In Stock',
-                'lead_time_days': 7,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_eaton_motors(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'Eaton',
-                'product_line': 'Crusher Duty',
-                'part_number': 'ED10HP',
-                'description': '10HP Crusher Duty Motor',
-                'specifications': {
-                    'hp': 10.0,
-                    'voltage': '480V',
-                    'efficiency_class': 'IE3',
-                    'efficiency_percent': 89.0,
-                    'rpm': 1800,
-                    'enclosure': 'TEFC',
-                    'duty': 'Crusher',
-                    'service_factor': 1.25
-                },
-                'datasheet_url': 'https://www.eaton.com/us/en-us/products/low-voltage-motor-controls/crusher-duty-motors.html',
-                'price_estimate': 3100.00,
-                'availability': 'In Stock',
-                'lead_time_days': 18,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_ge_motors(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'General Electric',
-                'product_line': 'Crusher Duty',
-                'part_number': '5KH49RN214G',
-                'description': '10HP Crusher Duty Motor',
-                'specifications': {
-                    'hp': 10.0,
-                    'voltage': '480V',
-                    'efficiency_class': 'IE3',
-                    'efficiency_percent': 89.0,
-                    'rpm': 1800,
-                    'enclosure': 'TEFC',
-                    'duty': 'Crusher',
-                    'service_factor': 1.15
-                },
-                'datasheet_url': 'https://www.ge.com/industrial-solutions/motors-generators/low-voltage-ac-motors',
-                'price_estimate': 2950.00,
-                'availability': 'In Stock',
-                'lead_time_days': 21,
-                'nec_compliant': True
-            }
-        ]
-    
-    def _get_baldor_motors(self) -> List[Dict]:
-        return [
-            {
-                'manufacturer': 'Baldor',
-                'product_line': 'General Duty',
-                'part_number': 'IDM3710T',
-                'description': '10HP General Purpose Motor',
-                'specifications': {
-                    'hp': 10.0,
-                    'voltage': '480V',
-                    'efficiency_class': 'IE3',
-                    'efficiency_percent': 89.5,
-                    'rpm': 1800,
-                    'enclosure': 'TEFC',
-                    'service_factor': 1.15
-                },
-                'datasheet_url': 'https://www.baldor.com/products/low-voltage-ac-motors',
-                'price_estimate': 2750.00,
-                'availability': 'In Stock',
-                'lead_time_days': 16,
-                'nec_compliant': True
-            }
-        ]
+
+_REC_TEMPLATE = "  {pn}: ${price:,.2f} - {reason}\n    Datasheet: {url}\n"
+
+def _format_recommendations(recommendations: Dict[str, List[PartRecommendation]], top: int = 2) -> List[str]:
+    """Render the top recommendations per manufacturer for the console"""
+    lines = []
+    for manufacturer, recs in recommendations.items():
+        lines.append(f"\n{manufacturer.upper()}:\n")
+        for rec in recs[:top]:
+            lines.append(_REC_TEMPLATE.format(pn=rec.part_number, price=rec.price_estimate,
+                                              reason=rec.reason_for_recommendation, url=rec.datasheet_url))
+    return lines
 
 def test_recommendation_engines():
     """Test the recommendation engines"""
-    print("Testing Recommendation Engines")
-    print("=" * 40)
+    out = ["Testing Recommendation Engines\n", "=" * 40 + "\n"]
     
     # Test Circuit Breaker Recommendations
-    print("\n🔌 CIRCUIT BREAKER RECOMMENDATIONS (100A)")
-    print("-" * 45)
+    out += ["\nCIRCUIT BREAKER RECOMMENDATIONS (100A)\n", "-" * 45 + "\n"]
     cb_engine = CircuitBreakerRecommendationEngine()
-    cb_recommendations = cb_engine.recommend_circuit_breakers(100, '480V', 'general')
-    
-    for manufacturer, recs in cb_recommendations.items():
-        print(f"\n{manufacturer.upper()}:")
-        for rec in recs[:2]:  # Show top 2
-            print(f"  {rec.part_number}: ${rec.price_estimate:.2f} - {rec.reason_for_recommendation}")
-            print(f"    📄 Datasheet: {rec.datasheet_url}")
+    cb_recommendations = cb_engine.recommend_circuit_breakers(100, '480V', Application.GENERAL)
+    out += _format_recommendations(cb_recommendations)
     
     # Test Motor Recommendations
-    print("\n\n🏭 MOTOR RECOMMENDATIONS (10HP)")
-    print("-" * 35)
+    out += ["\n\nMOTOR RECOMMENDATIONS (10HP)\n", "-" * 35 + "\n"]
     motor_engine = MotorRecommendationEngine()
     motor_recommendations = motor_engine.recommend_motors(10.0, '480V', 'IE3')
+    out += _format_recommendations(motor_recommendations)
     
-    for manufacturer, recs in motor_recommendations.items():
-        print(f"\n{manufacturer.upper()}:")
-        for rec in recs[:2]:  # Show top 2
-            print(f"  {rec.part_number}: ${rec.price_estimate:.2f} - {rec.reason_for_recommendation}")
-            print(f"    📄 Datasheet: {rec.datasheet_url}")
+    # One write for the whole report instead of a flush per line
+    sys.stdout.write("".join(out))
 
 if __name__ == "__main__":
     test_recommendation_engines()
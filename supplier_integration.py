@@ -3,22 +3,196 @@ Real Supplier Integration Module
 Integrates with actual electrical component suppliers and databases
 """
 
+import asyncio
+import functools
+import hashlib
+import inspect
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import numpy as np
+import os
 import pandas as pd
+import re
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from flask import current_app
 
 from bs4 import BeautifulSoup
+from config import DEFAULT_SUPPLIER_CACHE_DIR
 from real_components_data import get_real_components
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _make_session() -> requests.Session:
+    """HTTP session that keeps connections alive and retries transient failures.
+    
+    Searches are idempotent, so POSTs are retried too. Once retries run
+    out the last response is returned, so callers still see its status.
+    """
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=None, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Upper bound on concurrent requests per supplier batch, to respect rate limits
+SUPPLIER_MAX_WORKERS = 16
+
+def _fanout(fn, items, max_workers: int = SUPPLIER_MAX_WORKERS) -> list:
+    """fn applied to items on a thread pool, results in input order.
+    
+    Lets sync callers overlap supplier I/O without adopting asyncio; a
+    single item runs inline.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+def _loads(content: bytes):
+    """Parse a JSON response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _dumps(obj) -> str:
+    """Serialize a JSON request parameter, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+# Connection errors are retried with exponential backoff; HTTP error
+# statuses such as 401 are returned to the caller and never retried
+ASYNC_RETRY_ATTEMPTS = 3
+ASYNC_RETRY_BASE_DELAY = 0.5
+
+async def _fetch_json(session, method: str, url: str, **kwargs) -> Tuple[int, Optional[Dict]]:
+    """Issue one request on an aiohttp session and return (status, JSON body or None)"""
+    for attempt in range(ASYNC_RETRY_ATTEMPTS):
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                if response.status != 200:
+                    return response.status, None
+                return response.status, _loads(await response.read())
+        except aiohttp.ClientError:
+            if attempt == ASYNC_RETRY_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(ASYNC_RETRY_BASE_DELAY * 2 ** attempt)
+
+def _event_loop_running() -> bool:
+    """Whether the caller is already inside an asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+# Supplier lookups are cached for a day unless SUPPLIER_CACHE_TTL says otherwise
+DEFAULT_SUPPLIER_CACHE_TTL = 24 * 3600
+
+# OAuth tokens outlive the process in DEFAULT_SUPPLIER_CACHE_DIR so restarts
+# skip the handshake; they are dropped this long before they expire
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
+class TTLCache:
+    """Thread-safe in-process cache whose entries expire after ttl seconds.
+    
+    ttl=None keeps entries for the life of the process. When maxsize is
+    reached the oldest entry is dropped.
+    """
+    
+    def __init__(self, ttl: Optional[float] = DEFAULT_SUPPLIER_CACHE_TTL, maxsize: int = 4096):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Cached value for key, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires is not None and time.monotonic() >= expires:
+                del self._entries[key]
+                return None
+            return value
+    
+    def set(self, key, value):
+        """Store value under key for the cache's TTL"""
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (value, expires)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+def _cached_lookup(method):
+    """Memoize a supplier lookup in the instance's TTL cache (self._cache).
+    
+    The key is the lowercased text arguments, ignoring any aiohttp session,
+    so the sync and async variants of a lookup share entries. Failed
+    lookups (None) are not cached.
+    """
+    signature = inspect.signature(method)
+    
+    def cache_key(self, args, kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        return tuple((value or '').lower() for name, value in bound.arguments.items() if name not in ('self', 'session'))
+    
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            key = cache_key(self, args, kwargs)
+            result = self._cache.get(key)
+            if result is None:
+                result = await method(self, *args, **kwargs)
+                if result is not None:
+                    self._cache.set(key, result)
+            return result
+        return async_wrapper
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = cache_key(self, args, kwargs)
+        result = self._cache.get(key)
+        if result is None:
+            result = method(self, *args, **kwargs)
+            if result is not None:
+                self._cache.set(key, result)
+        return result
+    return wrapper
+
 class PriceFetcher:
     """Fetches live pricing from product URLs"""
     
@@ -48,7 +222,7 @@ class PriceFetcher:
             logger.error(f"Error fetching price from {url}: {e}")
             return 1.0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComponentSpec:
     """Electrical component specification structure"""
     manufacturer: str
@@ -66,7 +240,14 @@ class ComponentSpec:
     supplier_id: str
     manufacturer_url: str
 
-@dataclass
+# Closed vocabularies for quote fields; every quote references one shared
+# string per value, so equality checks while grouping short-circuit on identity
+SUPPLIER_DIGIKEY = sys.intern("Digi-Key")
+SUPPLIER_MOUSER = sys.intern("Mouser")
+AVAILABILITY_IN_STOCK = sys.intern("In Stock")
+AVAILABILITY_BACK_ORDER = sys.intern("Back Order")
+
+@dataclass(slots=True, frozen=True)
 class SupplierQuote:
     """Supplier quote structure"""
     supplier_name: str
@@ -78,31 +259,123 @@ class SupplierQuote:
     quote_id: str
     currency: str = "USD"
 
+def _quote_prefix(supplier_code: str) -> str:
+    """Quote id prefix for a batch, e.g. 'DK_20251129_'; computed once per batch"""
+    return f"{supplier_code}_{datetime.now().strftime('%Y%m%d')}_"
+
+def _quote_from_component(supplier_name: str, quote_prefix: str, component: ComponentSpec) -> SupplierQuote:
+    """Build a single-unit quote from a supplier search result"""
+    return SupplierQuote(
+        supplier_name=supplier_name,
+        part_number=component.part_number,
+        unit_price=component.price_usd,
+        minimum_quantity=1,
+        availability=AVAILABILITY_IN_STOCK if component.stock_available > 0 else AVAILABILITY_BACK_ORDER,
+        lead_time=component.lead_time_days,
+        quote_id=quote_prefix + component.part_number
+    )
+
 class DigiKeyAPI:
     """Digi-Key API integration for real-time pricing and availability"""
     
-    def __init__(self, client_id: str, client_secret: str):
+    AUTH_URL = "https://api.digikey.com/oauth/token"
+    
+    def __init__(self, client_id: str, client_secret: str, cache_ttl: Optional[float] = DEFAULT_SUPPLIER_CACHE_TTL,
+                 token_cache_dir: Optional[str] = DEFAULT_SUPPLIER_CACHE_DIR):
         self.client_id = client_id
         self.client_secret = client_secret
         self.base_url = "https://api.digikey.com/v1"
         self.access_token = None
         self.token_expires = None
+        self.token_cache_dir = token_cache_dir
+        self._cache = TTLCache(cache_ttl)
+        self.session = _make_session()
     
-    def authenticate(self) -> bool:
-        """Authenticate with Digi-Key API"""
-        auth_url = "https://api.digikey.com/oauth/token"
-        payload = {
+    def _auth_payload(self) -> Dict:
+        """Client-credentials grant for the token endpoint"""
+        return {
             "client_id": self.client_id,
             "client_secret": self.client_secret,
             "grant_type": "client_credentials"
         }
+    
+    def _store_token(self, token_data: Dict):
+        """Keep the access token and when it expires, in memory and on disk"""
+        self.access_token = token_data['access_token']
+        self.token_expires = datetime.now() + timedelta(seconds=token_data['expires_in'])
+        logger.info("Digi-Key API authenticated successfully")
+        self._persist_token()
+    
+    def _token_valid(self) -> bool:
+        """Whether a usable access token is in memory or persisted by an earlier process"""
+        if self.access_token and datetime.now() < self.token_expires:
+            return True
+        return self._load_persisted_token()
+    
+    def _token_path(self) -> Optional[str]:
+        """Token file for this client id, or None when persistence is disabled"""
+        if not self.token_cache_dir:
+            return None
+        digest = hashlib.sha256(self.client_id.encode()).hexdigest()[:16]
+        return os.path.join(self.token_cache_dir, f"digikey_token_{digest}.json")
+    
+    def _token_dir_trusted(self) -> bool:
+        """Whether the token directory is a real directory only this user can access"""
         try:
-            response = requests.post(auth_url, data=payload)
+            info = os.lstat(self.token_cache_dir)
+        except OSError:
+            return False
+        if not stat.S_ISDIR(info.st_mode):
+            return False
+        if hasattr(os, 'getuid'):
+            return info.st_uid == os.getuid() and not info.st_mode & 0o077
+        return True
+    
+    def _persist_token(self):
+        """Write the token (owner-only) so other processes can reuse it until shortly before expiry"""
+        path = self._token_path()
+        if path is None:
+            return
+        record = {
+            "access_token": self.access_token,
+            "expires_at": (self.token_expires - TOKEN_EXPIRY_MARGIN).timestamp()
+        }
+        try:
+            os.makedirs(self.token_cache_dir, mode=0o700, exist_ok=True)
+            if not self._token_dir_trusted():
+                logger.warning(f"Not persisting Digi-Key token: {self.token_cache_dir} is not private to this user")
+                return
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with os.fdopen(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as token_file:
+                json.dump(record, token_file)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist Digi-Key token: {e}")
+    
+    def _load_persisted_token(self) -> bool:
+        """Adopt a persisted token that has not expired yet"""
+        path = self._token_path()
+        if path is None or not self._token_dir_trusted():
+            return False
+        try:
+            with open(path) as token_file:
+                record = json.load(token_file)
+            expires = datetime.fromtimestamp(record['expires_at'])
+            access_token = record['access_token']
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if datetime.now() >= expires:
+            return False
+        self.access_token = access_token
+        self.token_expires = expires
+        return True
+    
+    def authenticate(self) -> bool:
+        """Authenticate with Digi-Key API"""
+        try:
+            response = self.session.post(self.AUTH_URL, data=self._auth_payload())
             if response.status_code == 200:
-                token_data = response.json()
-                self.access_token = token_data['access_token']
-                self.token_expires = datetime.now() + timedelta(seconds=token_data['expires_in'])
-                logger.info("Digi-Key API authenticated successfully")
+                self._store_token(_loads(response.content))
                 return True
             else:
                 logger.error(f"Digi-Key authentication failed: {response.status_code}")
@@ -111,12 +384,20 @@ class DigiKeyAPI:
             logger.error(f"Digi-Key authentication error: {e}")
             return False
     
-    def search_component(self, part_number: str, manufacturer: str = None) -> Optional[ComponentSpec]:
-        """Search for component by part number"""
-        if not self.access_token or datetime.now() >= self.token_expires:
-            if not self.authenticate():
-                return None
-        
+    async def authenticate_async(self, session) -> bool:
+        """Authenticate with Digi-Key API on an aiohttp session"""
+        try:
+            status, token_data = await _fetch_json(session, "POST", self.AUTH_URL, data=self._auth_payload())
+            if status == 200:
+                self._store_token(token_data)
+                return True
+            logger.error(f"Digi-Key authentication failed: {status}")
+        except Exception as e:
+            logger.error(f"Digi-Key authentication error: {e}")
+        return False
+    
+    def _search_request(self, part_number: str, manufacturer: str = None) -> Tuple[str, Dict, Dict]:
+        """URL, headers and query parameters for a part number search"""
         headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json"
@@ -130,56 +411,88 @@ class DigiKeyAPI:
         }
         
         if manufacturer:
-            params["filters"] = json.dumps({"manufacturer": manufacturer})
+            params["filters"] = _dumps({"manufacturer": manufacturer})
+        
+        return search_url, headers, params
+    
+    @_cached_lookup
+    def search_component(self, part_number: str, manufacturer: str = None) -> Optional[ComponentSpec]:
+        """Search for component by part number"""
+        if not self._token_valid():
+            if not self.authenticate():
+                return None
         
+        search_url, headers, params = self._search_request(part_number, manufacturer)
         try:
-            response = requests.get(search_url, headers=headers, params=params)
+            response = self.session.get(search_url, headers=headers, params=params)
             if response.status_code == 200:
-                data = response.json()
-                if 'products' in data and data['products']:
-                    product = data['products'][0]
-                    return ComponentSpec(
-                        manufacturer=product.get('manufacturer', ''),
-                        part_number=product.get('digi_key_part_number', ''),
-                        description=product.get('description', ''),
-                        voltage_rating=product.get('voltage_rating', ''),
-                        current_rating=product.get('current_rating', ''),
-                        datasheet_url=product.get('datasheet_url', ''),
-                        ul_certified=product.get('ul_certificate', False),
-                        nec_compliant=self._check_nec_compliance(product),
-                        price_usd=float(product.get('pricing', [{}])[0].get('unit_price', 0.0)),
-                        stock_available=product.get('stock_quantity', 0),
-                        lead_time_days=product.get('lead_time_days', 7),
-                        supplier_id="Digi-Key",
-                        manufacturer_url=product.get('manufacturer_url', '')
-                    )
+                return self._parse_search(_loads(response.content))
         except Exception as e:
             logger.error(f"Digi-Key search error: {e}")
         
         return None
     
-    def get_multiple_quotes(self, parts: List[Dict]) -> List[SupplierQuote]:
-        """Get pricing for multiple parts"""
-        quotes = []
+    @_cached_lookup
+    async def search_component_async(self, session, part_number: str, manufacturer: str = None) -> Optional[ComponentSpec]:
+        """Search for component by part number on an aiohttp session"""
+        if not self._token_valid():
+            if not await self.authenticate_async(session):
+                return None
         
-        for part in parts:
-            component = self.search_component(
-                part['part_number'], 
-                part.get('manufacturer')
+        search_url, headers, params = self._search_request(part_number, manufacturer)
+        try:
+            status, data = await _fetch_json(session, "GET", search_url, headers=headers, params=params)
+            if status == 200:
+                return self._parse_search(data)
+        except Exception as e:
+            logger.error(f"Digi-Key search error: {e}")
+        
+        return None
+    
+    def _parse_search(self, data: Dict) -> Optional[ComponentSpec]:
+        """First product of a search response as a ComponentSpec"""
+        if 'products' in data and data['products']:
+            product = data['products'][0]
+            return ComponentSpec(
+                manufacturer=product.get('manufacturer', ''),
+                part_number=product.get('digi_key_part_number', ''),
+                description=product.get('description', ''),
+                category=product.get('category', 'Unknown'),
+                voltage_rating=product.get('voltage_rating', ''),
+                current_rating=product.get('current_rating', ''),
+                datasheet_url=product.get('datasheet_url', ''),
+                ul_certified=product.get('ul_certificate', False),
+                nec_compliant=self._check_nec_compliance(product),
+                price_usd=float(product.get('pricing', [{}])[0].get('unit_price', 0.0)),
+                stock_available=product.get('stock_quantity', 0),
+                lead_time_days=product.get('lead_time_days', 7),
+                supplier_id=SUPPLIER_DIGIKEY,
+                manufacturer_url=product.get('manufacturer_url', '')
             )
-            if component:
-                quote = SupplierQuote(
-                    supplier_name="Digi-Key",
-                    part_number=component.part_number,
-                    unit_price=component.price_usd,
-                    minimum_quantity=1,
-                    availability="In Stock" if component.stock_available > 0 else "Back Order",
-                    lead_time=component.lead_time_days,
-                    quote_id=f"DK_{datetime.now().strftime('%Y%m%d')}_{component.part_number}"
-                )
-                quotes.append(quote)
+        return None
+    
+    def get_multiple_quotes(self, parts: List[Dict]) -> List[SupplierQuote]:
+        """Get pricing for multiple parts, searching them on a thread pool"""
+        # Authenticate once up front so concurrent searches share one token
+        if not self._token_valid() and not self.authenticate():
+            return []
         
-        return quotes
+        components = _fanout(lambda part: self.search_component(part['part_number'], part.get('manufacturer')), parts)
+        quote_prefix = _quote_prefix("DK")
+        return [_quote_from_component(SUPPLIER_DIGIKEY, quote_prefix, component) for component in components if component]
+    
+    async def get_multiple_quotes_async(self, session, parts: List[Dict]) -> List[SupplierQuote]:
+        """Get pricing for multiple parts with all searches in flight at once"""
+        # Authenticate once up front so concurrent searches share one token
+        if not self._token_valid() and not await self.authenticate_async(session):
+            return []
+        
+        components = await asyncio.gather(*(
+            self.search_component_async(session, part['part_number'], part.get('manufacturer'))
+            for part in parts
+        ))
+        quote_prefix = _quote_prefix("DK")
+        return [_quote_from_component(SUPPLIER_DIGIKEY, quote_prefix, component) for component in components if component]
     
     def _check_nec_compliance(self, product: Dict) -> bool:
         """Check if component complies with NEC standards"""
@@ -195,12 +508,14 @@ class DigiKeyAPI:
 class MouserAPI:
     """Mouser Electronics API integration"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_ttl: Optional[float] = DEFAULT_SUPPLIER_CACHE_TTL):
         self.api_key = api_key
         self.base_url = "https://api.mouser.com/api/v1"
+        self._cache = TTLCache(cache_ttl)
+        self.session = _make_session()
     
-    def search_component(self, part_number: str) -> Optional[ComponentSpec]:
-        """Search for component on Mouser"""
+    def _search_request(self, part_number: str) -> Tuple[str, Dict, Dict]:
+        """URL, headers and JSON payload for a part number search"""
         search_url = f"{self.base_url}/search/partnumber"
         
         payload = {
@@ -210,42 +525,67 @@ class MouserAPI:
             "Authorization": self.api_key,
             "Content-Type": "application/json"
         }
-        
+        return search_url, headers, payload
+    
+    @_cached_lookup
+    def search_component(self, part_number: str) -> Optional[ComponentSpec]:
+        """Search for component on Mouser"""
+        search_url, headers, payload = self._search_request(part_number)
         try:
-            response = requests.post(search_url, headers=headers, json=payload)
+            response = self.session.post(search_url, headers=headers, json=payload)
             if response.status_code == 200:
-                data = response.json()
-                if 'Parts' in data and data['Parts']:
-                    part = data['Parts'][0]
-                    return ComponentSpec(
-                        manufacturer=part.get('Manufacturer', ''),
-                        part_number=part.get('MouserPartNumber', ''),
-                        description=part.get('Description', ''),
-                        voltage_rating=part.get('Specification', ''),
-                        current_rating=part.get('CurrentRating', ''),
-                        datasheet_url=part.get('DataSheetUrl', ''),
-                        ul_certified=part.get('UL', False),
-                        nec_compliant=True,  # Assume compliant for now
-                        price_usd=float(part.get('PriceBreaks', [{}])[0].get('Price', 0.0)),
-                        stock_available=int(part.get('Availability', '0').replace('"', '').replace(',', '')),
-                        lead_time_days=7,  # Default
-                        supplier_id="Mouser",
-                        manufacturer_url=part.get('DataSheetUrl', '')
-                    )
+                return self._parse_search(_loads(response.content))
         except Exception as e:
             logger.error(f"Mouser search error: {e}")
         
         return None
+    
+    @_cached_lookup
+    async def search_component_async(self, session, part_number: str) -> Optional[ComponentSpec]:
+        """Search for component on Mouser on an aiohttp session"""
+        search_url, headers, payload = self._search_request(part_number)
+        try:
+            status, data = await _fetch_json(session, "POST", search_url, headers=headers, json=payload)
+            if status == 200:
+                return self._parse_search(data)
+        except Exception as e:
+            logger.error(f"Mouser search error: {e}")
+        
+        return None
+    
+    def _parse_search(self, data: Dict) -> Optional[ComponentSpec]:
+        """First part of a search response as a ComponentSpec"""
+        if 'Parts' in data and data['Parts']:
+            part = data['Parts'][0]
+            return ComponentSpec(
+                manufacturer=part.get('Manufacturer', ''),
+                part_number=part.get('MouserPartNumber', ''),
+                description=part.get('Description', ''),
+                category=part.get('Category', 'Unknown'),
+                voltage_rating=part.get('Specification', ''),
+                current_rating=part.get('CurrentRating', ''),
+                datasheet_url=part.get('DataSheetUrl', ''),
+                ul_certified=part.get('UL', False),
+                nec_compliant=True,  # Assume compliant for now
+                price_usd=float(part.get('PriceBreaks', [{}])[0].get('Price', 0.0)),
+                stock_available=int(part.get('Availability', '0').replace('"', '').replace(',', '')),
+                lead_time_days=7,  # Default
+                supplier_id=SUPPLIER_MOUSER,
+                manufacturer_url=part.get('DataSheetUrl', '')
+            )
+        return None
 
 class ULDatabase:
     """UL Certification Database integration"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_ttl: Optional[float] = DEFAULT_SUPPLIER_CACHE_TTL):
         self.api_key = api_key
         self.base_url = "https://productiq.ulprospector.com/api"
+        self._cache = TTLCache(cache_ttl)
+        self.session = _make_session()
     
-    def verify_certification(self, part_number: str, manufacturer: str) -> Dict:
-        """Verify UL certification for a component"""
+    def _search_request(self, part_number: str, manufacturer: str) -> Tuple[str, Dict, Dict]:
+        """URL, headers and JSON payload for a certification lookup"""
         search_url = f"{self.base_url}/product/search"
         
         headers = {
@@ -258,32 +598,91 @@ class ULDatabase:
             "manufacturer": manufacturer,
             "certification_type": ["UL", "CSA", "CE"]
         }
-        
+        return search_url, headers, payload
+    
+    def verify_certification(self, part_number: str, manufacturer: str) -> Dict:
+        """Verify UL certification for a component"""
+        return dict(self._lookup_certification(part_number, manufacturer) or self._parse_certification({}))
+    
+    async def verify_certification_async(self, session, part_number: str, manufacturer: str) -> Dict:
+        """Verify UL certification for a component on an aiohttp session"""
+        certification = await self._lookup_certification_async(session, part_number, manufacturer)
+        return dict(certification or self._parse_certification({}))
+    
+    @_cached_lookup
+    def _lookup_certification(self, part_number: str, manufacturer: str) -> Optional[Dict]:
+        """Certification data from UL, or None when the lookup failed"""
+        search_url, headers, payload = self._search_request(part_number, manufacturer)
         try:
-            response = requests.post(search_url, headers=headers, json=payload)
+            response = self.session.post(search_url, headers=headers, json=payload)
             if response.status_code == 200:
-                data = response.json()
-                return {
-                    "ul_listed": data.get('ul_listed', False),
-                    "certification_number": data.get('ul_file_number', ''),
-                    "standards": data.get('standards_applied', []),
-                    "expiration_date": data.get('certification_expiry', ''),
-                    "guide_information": data.get('guide_info', '')
-                }
+                return self._parse_certification(_loads(response.content))
         except Exception as e:
             logger.error(f"UL certification check error: {e}")
         
+        return None
+    
+    @_cached_lookup
+    async def _lookup_certification_async(self, session, part_number: str, manufacturer: str) -> Optional[Dict]:
+        """Certification data from UL on an aiohttp session, or None when the lookup failed"""
+        search_url, headers, payload = self._search_request(part_number, manufacturer)
+        try:
+            status, data = await _fetch_json(session, "POST", search_url, headers=headers, json=payload)
+            if status == 200:
+                return self._parse_certification(data)
+        except Exception as e:
+            logger.error(f"UL certification check error: {e}")
+        
+        return None
+    
+    @staticmethod
+    def _parse_certification(data: Dict) -> Dict:
+        """Certification fields from a UL response; an empty response means not listed"""
         return {
-            "ul_listed": False,
-            "certification_number": "",
-            "standards": [],
-            "expiration_date": "",
-            "guide_information": ""
+            "ul_listed": data.get('ul_listed', False),
+            "certification_number": data.get('ul_file_number', ''),
+            "standards": data.get('standards_applied', []),
+            "expiration_date": data.get('certification_expiry', ''),
+            "guide_information": data.get('guide_info', '')
         }
 
+# Leading number of a rating such as '480V', '230/400V' or '0.5A'
+_RATING_NUMBER = re.compile(r'\s*([-+]?(?:\d+\.?\d*|\.\d+))')
+
+def _rating_value(rating: str) -> float:
+    """Numeric part of a voltage/current rating, NaN when missing"""
+    match = _RATING_NUMBER.match(rating) if rating else None
+    return float(match.group(1)) if match else float('nan')
+
 class NECComplianceChecker:
     """NEC compliance checking for electrical components"""
     
+    # Description keywords that bring an NEC section into scope, scanned in
+    # one pass by a single compiled alternation
+    SECTION_KEYWORDS = {
+        'wire': 'section_310_60',
+        'cable': 'section_310_60',
+        'breaker': 'section_430_52',
+        'circuit': 'section_430_52',
+        'ground': 'section_250_4',
+        'bond': 'section_250_4'
+    }
+    SECTION_ORDER = ('section_310_60', 'section_430_52', 'section_250_4')
+    _KEYWORD_PATTERN = re.compile('|'.join(SECTION_KEYWORDS))
+    
+    # The rule set is fixed, so the (issues, warnings) for every combination of
+    # (low voltage, low current, not UL certified) is worked out up front
+    _CHECK_OUTCOMES = {
+        (low_voltage, low_current, not_certified): (
+            ("Component not UL certified - may not meet safety requirements",) if not_certified else (),
+            (("Low voltage component - verify application requirements",) if low_voltage else ())
+            + (("Low current component - verify load requirements",) if low_current else ())
+        )
+        for low_voltage in (False, True)
+        for low_current in (False, True)
+        for not_certified in (False, True)
+    }
+    
     def __init__(self):
         self.nec_codes = {
             'section_310_60': {
@@ -302,45 +701,47 @@ class NECComplianceChecker:
     
     def check_component_compliance(self, component: ComponentSpec) -> Dict:
         """Check component against NEC requirements"""
-        compliance_issues = []
-        warnings = []
-        approvals = []
-        
-        # Voltage rating check
-        if component.voltage_rating and float(component.voltage_rating.split('V')[0]) < 120:
-            warnings.append("Low voltage component - verify application requirements")
-        
-        # Current rating check
-        if component.current_rating and float(component.current_rating.split('A')[0]) < 1.0:
-            warnings.append("Low current component - verify load requirements")
+        return self._compliance_result(
+            component,
+            low_voltage=_rating_value(component.voltage_rating) < 120,
+            low_current=_rating_value(component.current_rating) < 1.0,
+            not_certified=not component.ul_certified
+        )
+    
+    def check_components_compliance(self, components: List[ComponentSpec]) -> List[Dict]:
+        """Check many components at once; same results as check_component_compliance.
         
-        # UL certification check
-        if not component.ul_certified:
-            compliance_issues.append("Component not UL certified - may not meet safety requirements")
+        Ratings are parsed into arrays once and the numeric checks run as
+        NumPy comparisons over the whole list; NaN ratings raise no warning.
+        """
+        count = len(components)
+        volts = np.fromiter((_rating_value(c.voltage_rating) for c in components), dtype=np.float64, count=count)
+        amps = np.fromiter((_rating_value(c.current_rating) for c in components), dtype=np.float64, count=count)
+        ul_certified = np.fromiter((bool(c.ul_certified) for c in components), dtype=np.bool_, count=count)
+        low_voltage = volts < 120.0
+        low_current = amps < 1.0
+        not_certified = ~ul_certified
         
+        return [
+            self._compliance_result(component, *flags)
+            for component, flags in zip(components, zip(low_voltage.tolist(), low_current.tolist(), not_certified.tolist()))
+        ]
+    
+    def _compliance_result(self, component: ComponentSpec, low_voltage: bool, low_current: bool, not_certified: bool) -> Dict:
+        """Compliance report for a component from its evaluated checks"""
+        compliance_issues, warnings = self._CHECK_OUTCOMES[low_voltage, low_current, not_certified]
         return {
-            "approved": len(compliance_issues) == 0,
-            "issues": compliance_issues,
-            "warnings": warnings,
-            "approvals": approvals,
+            "approved": not compliance_issues,
+            "issues": list(compliance_issues),
+            "warnings": list(warnings),
+            "approvals": [],
             "nec_sections_applied": self._determine_applicable_sections(component)
         }
     
     def _determine_applicable_sections(self, component: ComponentSpec) -> List[str]:
         """Determine which NEC sections apply to this component"""
-        applicable_sections = []
-        
-        # Simple logic to determine applicable NEC sections
-        if 'wire' in component.description.lower() or 'cable' in component.description.lower():
-            applicable_sections.append('section_310_60')
-        
-        if 'breaker' in component.description.lower() or 'circuit' in component.description.lower():
-            applicable_sections.append('section_430_52')
-        
-        if 'ground' in component.description.lower() or 'bond' in component.description.lower():
-            applicable_sections.append('section_250_4')
-        
-        return applicable_sections
+        found = {self.SECTION_KEYWORDS[match.group()] for match in self._KEYWORD_PATTERN.finditer(component.description.lower())}
+        return [section for section in self.SECTION_ORDER if section in found]
 
 class ElectricalComponentsDatabase:
     """Main class for electrical components database integration"""
@@ -351,47 +752,79 @@ class ElectricalComponentsDatabase:
         self.ul_db = None
         self.nec_checker = NECComplianceChecker()
         
+        # Index the local catalog once: exact part numbers resolve with a dict
+        # lookup, substring queries scan pre-lowercased part numbers
+        real_components = get_real_components()
+        self._components_lower = [(data['part_number'].lower(), data) for data in real_components]
+        self._components_by_pn = {}
+        for part_number_lower, data in self._components_lower:
+            self._components_by_pn.setdefault(part_number_lower, data)
+        self._manufacturers_lower = {data['manufacturer']: data['manufacturer'].lower() for data in real_components}
+        
+        # Supplier lookups are cached per API; None caches them for the process lifetime
+        cache_ttl = app_config.get('SUPPLIER_CACHE_TTL', DEFAULT_SUPPLIER_CACHE_TTL)
+        
         # Initialize APIs based on configuration
         if app_config.get('DIGIKEY_CLIENT_ID'):
             self.digikey = DigiKeyAPI(
                 app_config['DIGIKEY_CLIENT_ID'],
-                app_config['DIGIKEY_CLIENT_SECRET']
+                app_config['DIGIKEY_CLIENT_SECRET'],
+                cache_ttl,
+                app_config.get('SUPPLIER_CACHE_DIR', DEFAULT_SUPPLIER_CACHE_DIR)
             )
         
         if app_config.get('MOUSER_API_KEY'):
-            self.mouser = MouserAPI(app_config['MOUSER_API_KEY'])
+            self.mouser = MouserAPI(app_config['MOUSER_API_KEY'], cache_ttl)
         
         if app_config.get('UL_API_KEY'):
-            self.ul_db = ULDatabase(app_config['UL_API_KEY'])
+            self.ul_db = ULDatabase(app_config['UL_API_KEY'], cache_ttl)
     
     def search_component(self, part_number: str) -> Optional[ComponentSpec]:
         """Search in Real Component Database"""
-        real_components = get_real_components()
-        for data in real_components:
-            if part_number.lower() in data['part_number'].lower():
-                # Simulate live pricing fetch
-                price_variation = PriceFetcher.fetch_price(data['datasheet_url'])
-                
-                # Create ComponentSpec from real data
-                # Note: Some fields might need to be inferred or added to the real data dict
-                return ComponentSpec(
-                    manufacturer=data['manufacturer'],
-                    part_number=data['part_number'],
-                    description=data['description'],
-                    category=data.get('category', 'Unknown'),
-                    voltage_rating=data['voltage_rating'],
-                    current_rating=data['current_rating'],
-                    datasheet_url=data['datasheet_url'],
-                    ul_certified=True, # Assumed for major brands
-                    nec_compliant=True,
-                    price_usd=100.0 * price_variation, # Placeholder base price if not in DB, or add price to DB
-                    stock_available=50, # Simulated stock
-                    lead_time_days=3,
-                    supplier_id=data['supplier_id'],
-                    manufacturer_url=data['datasheet_url']
-                )
+        data = self._find_real_component(part_number.lower())
+        if data is not None:
+            # Simulate live pricing fetch
+            price_variation = PriceFetcher.fetch_price(data['datasheet_url'])
+            
+            # Create ComponentSpec from real data
+            # Note: Some fields might need to be inferred or added to the real data dict
+            return ComponentSpec(
+                manufacturer=data['manufacturer'],
+                part_number=data['part_number'],
+                description=data['description'],
+                category=data.get('category', 'Unknown'),
+                voltage_rating=data['voltage_rating'],
+                current_rating=data['current_rating'],
+                datasheet_url=data['datasheet_url'],
+                ul_certified=True, # Assumed for major brands
+                nec_compliant=True,
+                price_usd=100.0 * price_variation, # Placeholder base price if not in DB, or add price to DB
+                stock_available=50, # Simulated stock
+                lead_time_days=3,
+                supplier_id=data['supplier_id'],
+                manufacturer_url=data['datasheet_url']
+            )
         return None
     
+    def _find_real_component(self, part_number_lower: str) -> Optional[Dict]:
+        """Catalog row for an exact part number, else the first one containing the query"""
+        data = self._components_by_pn.get(part_number_lower)
+        if data is not None:
+            return data
+        for candidate_lower, data in self._components_lower:
+            if part_number_lower in candidate_lower:
+                return data
+        return None
+    
+    def _manufacturer_matches(self, component: ComponentSpec, manufacturer: Optional[str]) -> bool:
+        """True when no manufacturer filter is given or it is part of the component's manufacturer"""
+        if not manufacturer:
+            return True
+        manufacturer_lower = self._manufacturers_lower.get(component.manufacturer)
+        if manufacturer_lower is None:
+            manufacturer_lower = component.manufacturer.lower()
+        return manufacturer.lower() in manufacturer_lower
+    
     def search_component_comprehensive(self, part_number: str, manufacturer: str = None) -> List[ComponentSpec]:
         """Search across all available suppliers"""
         components = []
@@ -400,22 +833,27 @@ class ElectricalComponentsDatabase:
         local_component = self.search_component(part_number)
         if local_component:
             # Filter by manufacturer if provided
-            if not manufacturer or manufacturer.lower() in local_component.manufacturer.lower():
+            if self._manufacturer_matches(local_component, manufacturer):
                 components.append(local_component)
         
-        # Search Digi-Key
+        # Search Digi-Key and Mouser side by side
+        searches = {}
         if self.digikey:
-            component = self.digikey.search_component(part_number, manufacturer)
-            if component:
-                components.append(component)
-        
-        # Search Mouser
+            searches['digikey'] = lambda: self.digikey.search_component(part_number, manufacturer)
         if self.mouser:
-            component = self.mouser.search_component(part_number)
-            if component:
-                # Avoid duplicates
-                if not any(c.part_number == component.part_number and c.supplier_id == component.supplier_id for c in components):
-                    components.append(component)
+            searches['mouser'] = lambda: self.mouser.search_component(part_number)
+        found = dict(zip(searches, _fanout(lambda search: search(), searches.values())))
+        
+        component = found.get('digikey')
+        if component:
+            components.append(component)
+        
+        component = found.get('mouser')
+        if component:
+            # Avoid duplicates
+            seen = {(c.part_number, c.supplier_id) for c in components}
+            if (component.part_number, component.supplier_id) not in seen:
+                components.append(component)
         
         return components
     
@@ -431,24 +869,110 @@ class ElectricalComponentsDatabase:
         # For Mouser, implement similar functionality
         # This is a simplified example
         if self.mouser:
-            for part in part_list:
-                component = self.mouser.search_component(part['part_number'])
-                if component:
-                    quote = SupplierQuote(
-                        supplier_name="Mouser",
-                        part_number=component.part_number,
-                        unit_price=component.price_usd,
-                        minimum_quantity=1,
-                        availability="In Stock" if component.stock_available > 0 else "Back Order",
-                        lead_time=component.lead_time_days,
-                        quote_id=f"MO_{datetime.now().strftime('%Y%m%d')}_{component.part_number}"
-                    )
-                    all_quotes.append(quote)
+            components = _fanout(lambda part: self.mouser.search_component(part['part_number']), part_list)
+            quote_prefix = _quote_prefix("MO")
+            all_quotes.extend(_quote_from_component(SUPPLIER_MOUSER, quote_prefix, component) for component in components if component)
+        
+        return all_quotes
+    
+    async def search_component_comprehensive_async(self, part_number: str, manufacturer: str = None, session=None) -> List[ComponentSpec]:
+        """Search across all available suppliers with remote lookups running concurrently"""
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self.search_component_comprehensive_async(part_number, manufacturer, session)
+        
+        components = []
+        
+        # Search Local Real Component Database
+        local_component = self.search_component(part_number)
+        if local_component:
+            # Filter by manufacturer if provided
+            if self._manufacturer_matches(local_component, manufacturer):
+                components.append(local_component)
+        
+        async def no_result():
+            return None
+        
+        digikey_component, mouser_component = await asyncio.gather(
+            self.digikey.search_component_async(session, part_number, manufacturer) if self.digikey else no_result(),
+            self.mouser.search_component_async(session, part_number) if self.mouser else no_result()
+        )
+        
+        if digikey_component:
+            components.append(digikey_component)
+        
+        if mouser_component:
+            # Avoid duplicates
+            seen = {(c.part_number, c.supplier_id) for c in components}
+            if (mouser_component.part_number, mouser_component.supplier_id) not in seen:
+                components.append(mouser_component)
         
+        return components
+    
+    async def get_best_pricing_async(self, part_list: List[Dict]) -> List[SupplierQuote]:
+        """Get best pricing from all suppliers, querying every part concurrently.
+        
+        One aiohttp session (and connection pool) is shared by all requests.
+        Quotes come back in the same order as get_best_pricing.
+        """
+        async with aiohttp.ClientSession() as session:
+            tasks = []
+            if self.digikey:
+                tasks.append(self.digikey.get_multiple_quotes_async(session, part_list))
+            if self.mouser:
+                tasks.extend(self.mouser.search_component_async(session, part['part_number']) for part in part_list)
+            results = await asyncio.gather(*tasks)
+        
+        all_quotes = []
+        if self.digikey:
+            all_quotes.extend(results[0])
+            results = results[1:]
+        quote_prefix = _quote_prefix("MO")
+        all_quotes.extend(_quote_from_component(SUPPLIER_MOUSER, quote_prefix, component) for component in results if component)
         return all_quotes
     
     def verify_certifications(self, component: ComponentSpec) -> Dict:
         """Verify certifications for a component"""
+        ul_data = None
+        
+        # Check UL database if available
+        if self.ul_db:
+            ul_data = self.ul_db.verify_certification(component.part_number, component.manufacturer)
+        
+        return self._certification_data(ul_data, self.nec_checker.check_component_compliance(component))
+    
+    def _verify_ul_batch(self, components: List[ComponentSpec]) -> List[Optional[Dict]]:
+        """UL data for each component, or None entries without a UL database.
+        
+        Distinct (part number, manufacturer) pairs are looked up concurrently
+        in one wave: on aiohttp when it is available and no event loop is
+        running, otherwise on a thread pool.
+        """
+        if not self.ul_db:
+            return [None] * len(components)
+        
+        keys = [(c.part_number, c.manufacturer) for c in components]
+        unique_keys = list(dict.fromkeys(keys))
+        if aiohttp is None or _event_loop_running():
+            results = _fanout(lambda key: self.ul_db.verify_certification(*key), unique_keys)
+        else:
+            results = asyncio.run(self._verify_ul_batch_async(unique_keys))
+        
+        # Each component gets its own copy, as verify_certification returns
+        by_key = dict(zip(unique_keys, results))
+        return [dict(by_key[key]) for key in keys]
+    
+    async def _verify_ul_batch_async(self, keys: List[Tuple[str, str]]) -> List[Dict]:
+        """UL lookups for (part number, manufacturer) pairs on one aiohttp session"""
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(*(
+                self.ul_db.verify_certification_async(session, part_number, manufacturer)
+                for part_number, manufacturer in keys
+            ))
+    
+    @staticmethod
+    def _certification_data(ul_data: Optional[Dict], nec_compliance: Dict) -> Dict:
+        """Combine UL lookup data and an NEC compliance result"""
         certification_data = {
             "ul_verified": False,
             "nec_compliant": False,
@@ -456,85 +980,97 @@ class ElectricalComponentsDatabase:
             "issues": []
         }
         
-        # Check UL database if available
-        if self.ul_db:
-            ul_data = self.ul_db.verify_certification(component.part_number, component.manufacturer)
+        if ul_data is not None:
             certification_data.update(ul_data)
             certification_data["ul_verified"] = ul_data.get("ul_listed", False)
         
-        # Check NEC compliance
-        nec_compliance = self.nec_checker.check_component_compliance(component)
         certification_data["nec_compliant"] = nec_compliance["approved"]
         certification_data["nec_issues"] = nec_compliance["issues"]
         certification_data["nec_warnings"] = nec_compliance["warnings"]
         
         return certification_data
     
+    # ComponentSpec field -> BOM report key, and the key order of each report row
+    BOM_COMPONENT_COLUMNS = {
+        'part_number': 'part_number',
+        'manufacturer': 'manufacturer',
+        'description': 'description',
+        'price_usd': 'price',
+        'stock_available': 'stock',
+        'lead_time_days': 'lead_time',
+        'ul_certified': 'ul_certified',
+        'datasheet_url': 'datasheet_url'
+    }
+    BOM_COMPONENT_FIELDS = ['part_number', 'manufacturer', 'description', 'price', 'stock', 'lead_time',
+                            'ul_certified', 'nec_compliant', 'certification_issues', 'datasheet_url']
+    
     def generate_bom_report(self, components: List[ComponentSpec]) -> Dict:
         """Generate comprehensive BOM report"""
+        # Summary, certification split and cost breakdowns are column operations
+        # Read by attribute so database rows work as well as ComponentSpec instances
+        columns = [f.name for f in fields(ComponentSpec)]
+        # The object frame keeps values as given for the per-part rows; the
+        # aggregates work on the same data with inferred numeric dtypes
+        records = pd.DataFrame([{name: getattr(c, name, None) for name in columns} for c in components],
+                               columns=columns, dtype=object)
+        df = records.infer_objects()
+        ul_certified = df['ul_certified'].astype(bool)
+        
+        # One grouped pass over the component rows; the total and both cost
+        # breakdowns roll up from the much smaller (manufacturer, supplier) table
+        groups = (df.groupby(['manufacturer', 'supplier_id'], sort=False, dropna=False)['price_usd']
+                    .agg(count='size', total_cost='sum')
+                    .reset_index())
+        
         report = {
             "summary": {
-                "total_parts": len(components),
-                "total_cost": sum(c.price_usd for c in components),
-                "ul_certified_count": sum(1 for c in components if c.ul_certified),
-                "nec_compliant_count": sum(1 for c in components if c.nec_compliant),
-                "unique_manufacturers": len(set(c.manufacturer for c in components))
+                "total_parts": len(df),
+                "total_cost": float(groups['total_cost'].sum()),
+                "ul_certified_count": int(ul_certified.sum()),
+                "nec_compliant_count": int(df['nec_compliant'].astype(bool).sum()),
+                "unique_manufacturers": int(df['manufacturer'].nunique(dropna=False))
             },
             "components": [],
             "certification_summary": {
-                "ul_certified": [],
-                "non_ul_certified": [],
+                "ul_certified": df.loc[ul_certified, 'part_number'].tolist(),
+                "non_ul_certified": df.loc[~ul_certified, 'part_number'].tolist(),
                 "nec_issues": []
             },
             "cost_analysis": {
-                "by_manufacturer": {},
-                "by_supplier": {}
+                "by_manufacturer": self._cost_breakdown(groups, 'manufacturer'),
+                "by_supplier": self._cost_breakdown(groups, 'supplier_id')
             }
         }
         
-        for component in components:
-            cert_data = self.verify_certifications(component)
-            
-            component_report = {
-                "part_number": component.part_number,
-                "manufacturer": component.manufacturer,
-                "description": component.description,
-                "price": component.price_usd,
-                "stock": component.stock_available,
-                "lead_time": component.lead_time_days,
-                "ul_certified": component.ul_certified,
-                "nec_compliant": cert_data["nec_compliant"],
-                "certification_issues": cert_data.get("nec_issues", []),
-                "datasheet_url": component.datasheet_url
-            }
-            report["components"].append(component_report)
-            
-            # Categorize by certification status
-            if component.ul_certified:
-                report["certification_summary"]["ul_certified"].append(component.part_number)
-            else:
-                report["certification_summary"]["non_ul_certified"].append(component.part_number)
-            
-            if not cert_data["nec_compliant"]:
-                report["certification_summary"]["nec_issues"].append(component.part_number)
-            
-            # Cost analysis
-            manufacturer = component.manufacturer
-            supplier = component.supplier_id
-            
-            if manufacturer not in report["cost_analysis"]["by_manufacturer"]:
-                report["cost_analysis"]["by_manufacturer"][manufacturer] = {"count": 0, "total_cost": 0.0}
-            
-            if supplier not in report["cost_analysis"]["by_supplier"]:
-                report["cost_analysis"]["by_supplier"][supplier] = {"count": 0, "total_cost": 0.0}
-            
-            report["cost_analysis"]["by_manufacturer"][manufacturer]["count"] += 1
-            report["cost_analysis"]["by_manufacturer"][manufacturer]["total_cost"] += component.price_usd
-            
-            report["cost_analysis"]["by_supplier"][supplier]["count"] += 1
-            report["cost_analysis"]["by_supplier"][supplier]["total_cost"] += component.price_usd
+        # All UL lookups go out as one I/O wave, then the CPU-only NEC checks run
+        ul_results = self._verify_ul_batch(components)
+        compliance = self.nec_checker.check_components_compliance(components)
+        
+        certification = [self._certification_data(ul_data, nec_compliance)
+                         for ul_data, nec_compliance in zip(ul_results, compliance)]
+        nec_compliant = [cert_data["nec_compliant"] for cert_data in certification]
+        
+        # Per-part rows come straight out of the frame instead of one dict literal per part
+        rows = (records[list(self.BOM_COMPONENT_COLUMNS)]
+                .rename(columns=self.BOM_COMPONENT_COLUMNS)
+                .assign(nec_compliant=nec_compliant,
+                        certification_issues=[cert_data.get("nec_issues", []) for cert_data in certification])
+                [self.BOM_COMPONENT_FIELDS])
+        # Missing values come back from pandas as NaN; report them as None
+        report["components"] = rows.astype(object).where(rows.notna(), None).to_dict(orient='records')
+        report["certification_summary"]["nec_issues"] = [
+            part_number for part_number, compliant in zip(df['part_number'], nec_compliant) if not compliant
+        ]
         
         return report
+    
+    @staticmethod
+    def _cost_breakdown(groups: pd.DataFrame, column: str) -> Dict[str, Dict]:
+        """Part count and total cost per value of column, in order of first appearance"""
+        grouped = groups.groupby(column, sort=False, dropna=False)[['count', 'total_cost']].sum()
+        # dropna=False keeps missing keys but reports them as NaN; restore None
+        return {(None if pd.isna(key) else key): {"count": int(row.count), "total_cost": float(row.total_cost)}
+                for key, row in zip(grouped.index, grouped.itertuples(index=False))}
 
 # Mock data for demonstration when real APIs are not available
 class MockSupplierAPI:
@@ -590,6 +1126,7 @@ class MockSupplierAPI:
     def get_best_pricing(self, parts: List[Dict]) -> List[SupplierQuote]:
         """Get pricing for list of parts"""
         quotes = []
+        quote_prefix = _quote_prefix("REAL")
         for part in parts:
             component = self.search_component(part['part_number'])
             if component:
@@ -598,9 +1135,9 @@ class MockSupplierAPI:
                     part_number=component.part_number,
                     unit_price=component.price_usd,
                     minimum_quantity=1,
-                    availability="In Stock",
+                    availability=AVAILABILITY_IN_STOCK,
                     lead_time=component.lead_time_days,
-                    quote_id=f"REAL_{datetime.now().strftime('%Y%m%d')}_{component.part_number}"
+                    quote_id=quote_prefix + component.part_number
                 )
                 quotes.append(quote)
         return quotes
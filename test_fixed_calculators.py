@@ -2,252 +2,313 @@
 """
 Test script for FIXED maintenance calculators
 Tests the three specific scenarios requested by the user
+Pass -v (or set TEST_VERBOSE=1) for the full per-scenario reports
+Exits with status 1 when any scenario fails
 """
 
+import io
+import os
 import sys
+from contextlib import redirect_stdout
 sys.path.append('/workspace')
 
 from maintenance_calculations_fixed import ElectricalCalculations
 import json
+import traceback
 
-def test_cable_sizing():
-    """Test Cable Sizing Calculator: 30A continuous load, 208V 3-phase, 150 feet, 40°C ambient"""
-    print("=" * 80)
-    print("TEST 1: CABLE SIZING CALCULATOR")
-    print("=" * 80)
-    print("Requirements:")
-    print("- Load Current: 30A (continuous)")
-    print("- Voltage: 208V 3-phase")
-    print("- Distance: 150 feet")
-    print("- Ambient Temperature: 40°C")
-    print("- Installation: Through conduit")
-    print()
-    
-    calculator = ElectricalCalculations()
-    
-    try:
-        result = calculator.calculate_cable_sizing(
-            load_current=30.0,
-            voltage=208.0,
-            cable_length=150,
-            cable_type="copper",
-            ambient_temperature=40.0,
-            installation_method="conduit"
-        )
-        
-        print("CABLE SIZING RESULTS:")
-        print("-" * 50)
-        print(f"✓ Recommended Cable Size: {result.get('cable_size', 'N/A')}")
-        print(f"✓ Voltage Drop: {result.get('voltage_drop_percent', 0):.2f}%")
-        print(f"✓ Max Allowable Voltage Drop: {result.get('max_voltage_drop_percent', 'N/A')}%")
-        print(f"✓ Ampacity Rating: {result.get('ampacity', 'N/A')} A")
-        print(f"✓ Base Ampacity: {result.get('base_ampacity', 'N/A')} A")
-        print(f"✓ Temperature Derating Factor: {result.get('temperature_derating', 'N/A')}")
-        print(f"✓ Installation Derating Factor: {result.get('installation_derating', 'N/A')}")
-        print(f"✓ Required Ampacity: {result.get('required_ampacity', 'N/A')} A")
-        print(f"✓ NEC Compliance: {'✅ YES' if result.get('nec_compliant', False) else '❌ NO'}")
-        print(f"✓ NEC Reference: {result.get('nec_reference', 'N/A')}")
-        print()
-        print("ANALYSIS:")
-        print(f"• Cable sized for 30A continuous load with 125% safety factor")
-        print(f"• Adjusted ampacity accounts for 40°C ambient temperature")
-        print(f"• Installation derating applied for conduit installation")
-        print(f"• {result.get('notes', 'No additional notes')}")
-        print()
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error in cable sizing calculation: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+# The calculations are pure, so every test shares one calculator
+CALCULATOR = ElectricalCalculations()
 
-def test_motor_sizing():
-    """Test Motor Sizing Calculator: Conveyor system 15HP, variable speed drive"""
-    print("=" * 80)
-    print("TEST 2: MOTOR SIZING CALCULATOR")
-    print("=" * 80)
-    print("Requirements:")
-    print("- Required Power: 15HP")
-    print("- Application: Conveyor system")
-    print("- Operation: Variable speed drive")
-    print("- Hours: 16 hours/day, 5 days/week")
-    print("- Efficiency: IE3 (Premium)")
-    print()
-    
-    calculator = ElectricalCalculations()
-    
-    try:
-        result = calculator.calculate_motor_sizing(
-            load_hp=15.0,
-            voltage=480.0,
-            phase=3,
-            speed_rpm=1800,
-            efficiency_class="IE3",
-            duty_cycle="continuous",
-            ambient_temperature=40.0
-        )
-        
-        print("MOTOR SIZING RESULTS:")
-        print("-" * 50)
-        print(f"✓ Recommended Motor Size: {result.get('motor_hp', 'N/A')} HP")
-        print(f"✓ Full Load Current (FLA): {result.get('full_load_current', 'N/A')} A")
-        print(f"✓ Locked Rotor Current (LRC): {result.get('locked_rotor_current', 'N/A')} A")
-        print(f"✓ Starting Current: {result.get('starting_current', 'N/A')} A")
-        print(f"✓ Efficiency Class: {result.get('efficiency_class', 'N/A')}")
-        print(f"✓ Efficiency: {result.get('efficiency_percent', 'N/A')}%")
-        print(f"✓ Power Factor: {result.get('power_factor', 'N/A')}")
-        print(f"✓ Service Factor: {result.get('service_factor', 'N/A')}")
-        print(f"✓ NEMA Frame Size: {result.get('nema_frame_size', 'N/A')}")
-        print(f"✓ Annual Energy Consumption: {result.get('annual_energy_kwh', 'N/A'):,} kWh")
-        print(f"✓ Annual Operating Cost: ${result.get('annual_operating_cost', 'N/A'):.2f}")
-        print(f"✓ Power Factor Correction Needed: {'Yes' if result.get('power_factor_correction_needed', False) else 'No'}")
-        print(f"✓ NEC Compliance: {'✅ YES' if result.get('nec_compliant', False) else '❌ NO'}")
-        print(f"✓ NEC Reference: {result.get('nec_reference', 'N/A')}")
-        print()
-        print("ANALYSIS:")
-        print(f"• Motor sized for 15HP conveyor load with VSD compatibility")
-        print(f"• IE3 premium efficiency reduces energy costs")
-        print(f"• Operating 16 hours/day, 5 days/week (4,160 hours/year)")
-        print(f"• {result.get('notes', 'No additional notes')}")
-        print()
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error in motor sizing calculation: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+# Full per-scenario reports only with -v or TEST_VERBOSE=1; otherwise just
+# failures and the pass/fail summary are written
+VERBOSE = '-v' in sys.argv or os.environ.get('TEST_VERBOSE') == '1'
 
-def test_circuit_breaker():
-    """Test Circuit Breaker Sizing: 25HP, 480V 3-phase motor, 34A FLA"""
-    print("=" * 80)
-    print("TEST 3: CIRCUIT BREAKER SIZING CALCULATOR")
-    print("=" * 80)
-    print("Requirements:")
-    print("- Motor: 25HP")
-    print("- Voltage: 480V 3-phase")
-    print("- Full Load Current: 34A")
-    print("- Continuous operation")
-    print("- Ambient Temperature: 40°C")
-    print()
-    
-    calculator = ElectricalCalculations()
+def yes_no(value):
+    """Yes/No for a boolean result field"""
+    return 'Yes' if value else 'No'
+
+def nec_yes_no(value):
+    """Marked YES/NO for an NEC compliance flag"""
+    return '✅ YES' if value else '❌ NO'
+
+# Each scenario: the calculator call, the requirements it models, and the
+# result fields to report as (label, result key, default, format)
+CALCULATOR_TESTS = [
+    {
+        # Cable Sizing Calculator: 30A continuous load, 208V 3-phase, 150 feet, 40°C ambient
+        'title': "CABLE SIZING",
+        'calculate': CALCULATOR.calculate_cable_sizing,
+        'inputs': {
+            'load_current': 30.0,
+            'voltage': 208.0,
+            'cable_length': 150,
+            'cable_type': "copper",
+            'ambient_temperature': 40.0,
+            'installation_method': "conduit"
+        },
+        'requirements': [
+            "Load Current: 30A (continuous)",
+            "Voltage: 208V 3-phase",
+            "Distance: 150 feet",
+            "Ambient Temperature: 40°C",
+            "Installation: Through conduit"
+        ],
+        'fields': [
+            ("Recommended Cable Size", 'cable_size', 'N/A', "{}"),
+            ("Voltage Drop", 'voltage_drop_percent', 0, "{:.2f}%"),
+            ("Max Allowable Voltage Drop", 'max_voltage_drop_percent', 'N/A', "{}%"),
+            ("Ampacity Rating", 'ampacity', 'N/A', "{} A"),
+            ("Base Ampacity", 'base_ampacity', 'N/A', "{} A"),
+            ("Temperature Derating Factor", 'temperature_derating', 'N/A', "{}"),
+            ("Installation Derating Factor", 'installation_derating', 'N/A', "{}"),
+            ("Required Ampacity", 'required_ampacity', 'N/A', "{} A")
+        ],
+        'analysis': [
+            "Cable sized for 30A continuous load with 125% safety factor",
+            "Adjusted ampacity accounts for 40°C ambient temperature",
+            "Installation derating applied for conduit installation"
+        ]
+    },
+    {
+        # Motor Sizing Calculator: Conveyor system 15HP, variable speed drive
+        'title': "MOTOR SIZING",
+        'calculate': CALCULATOR.calculate_motor_sizing,
+        'inputs': {
+            'load_hp': 15.0,
+            'voltage': 480.0,
+            'phase': 3,
+            'speed_rpm': 1800,
+            'efficiency_class': "IE3",
+            'duty_cycle': "continuous",
+            'ambient_temperature': 40.0
+        },
+        'requirements': [
+            "Required Power: 15HP",
+            "Application: Conveyor system",
+            "Operation: Variable speed drive",
+            "Hours: 16 hours/day, 5 days/week",
+            "Efficiency: IE3 (Premium)"
+        ],
+        'fields': [
+            ("Recommended Motor Size", 'motor_hp', 'N/A', "{} HP"),
+            ("Full Load Current (FLA)", 'full_load_current', 'N/A', "{} A"),
+            ("Locked Rotor Current (LRC)", 'locked_rotor_current', 'N/A', "{} A"),
+            ("Starting Current", 'starting_current', 'N/A', "{} A"),
+            ("Efficiency Class", 'efficiency_class', 'N/A', "{}"),
+            ("Efficiency", 'efficiency_percent', 'N/A', "{}%"),
+            ("Power Factor", 'power_factor', 'N/A', "{}"),
+            ("Service Factor", 'service_factor', 'N/A', "{}"),
+            ("NEMA Frame Size", 'nema_frame_size', 'N/A', "{}"),
+            ("Annual Energy Consumption", 'annual_energy_kwh', 'N/A', "{:,} kWh"),
+            ("Annual Operating Cost", 'annual_operating_cost', 'N/A', "${:.2f}"),
+            ("Power Factor Correction Needed", 'power_factor_correction_needed', False, yes_no)
+        ],
+        'analysis': [
+            "Motor sized for 15HP conveyor load with VSD compatibility",
+            "IE3 premium efficiency reduces energy costs",
+            "Operating 16 hours/day, 5 days/week (4,160 hours/year)"
+        ]
+    },
+    {
+        # Circuit Breaker Sizing: 25HP, 480V 3-phase motor, 34A FLA
+        'title': "CIRCUIT BREAKER SIZING",
+        'calculate': CALCULATOR.calculate_circuit_breaker_sizing,
+        'inputs': {
+            'continuous_load': 34.0,
+            'non_continuous_load': 0.0,
+            'voltage': 480.0,
+            'ambient_temperature': 40.0,
+            'application_type': "motor",
+            'short_circuit_current': 10000
+        },
+        'requirements': [
+            "Motor: 25HP",
+            "Voltage: 480V 3-phase",
+            "Full Load Current: 34A",
+            "Continuous operation",
+            "Ambient Temperature: 40°C"
+        ],
+        'fields': [
+            ("Recommended Breaker Size", 'breaker_size', 'N/A', "{} A"),
+            ("Total Load", 'total_load', 'N/A', "{} A"),
+            ("Continuous Load", 'continuous_load', 'N/A', "{} A"),
+            ("Calculation Method", 'calculation_method', 'N/A', "{}"),
+            ("Safety Factor", 'safety_factor', 'N/A', "{}"),
+            ("Temperature Derating", 'temperature_derating', 'N/A', "{}"),
+            ("Interrupting Capacity", 'interrupting_capacity', 'N/A', "{:,} A"),
+            ("Wire Ampacity Required", 'wire_ampacity_required', 'N/A', "{} A"),
+            ("Short Circuit Capacity", 'short_circuit_capacity', 'N/A', "{}")
+        ],
+        'analysis': [
+            "Breaker sized per NEC 430.52 for motor protection",
+            "125% safety factor applied for continuous operation",
+            "Suitable for 25HP motor with 34A FLA",
+            "Interrupting capacity exceeds available fault current"
+        ]
+    }
+]
+
+# Reported for every calculator after its own fields
+NEC_FIELDS = [
+    ("NEC Compliance", 'nec_compliant', False, nec_yes_no),
+    ("NEC Reference", 'nec_reference', 'N/A', "{}")
+]
+
+def results_template(test):
+    """str.format_map template for a scenario's results, keyed by result field"""
+    lines = [f"{test['title']} RESULTS:", "-" * 50]
+    for label, key, default, fmt in test['fields'] + NEC_FIELDS:
+        # Formatter functions run before rendering; format strings get the key spliced in
+        lines.append(f"✓ {label}: " + ("{" + key + "}" if callable(fmt) else fmt.replace("{", "{" + key, 1)))
+    lines += ["", "ANALYSIS:"]
+    lines += [f"• {note}" for note in test['analysis']]
+    lines += ["• {notes}", "", ""]
+    return "\n".join(lines)
+
+# Parse each scenario's report layout once, at import
+for test in CALCULATOR_TESTS:
+    test['template'] = results_template(test)
+
+def run_calculations(tests):
+    """Run every scenario's calculation in one pass; (result, error) per test"""
+    outcomes = []
+    for test in tests:
+        try:
+            outcomes.append((test['calculate'](**test['inputs']), None))
+        except Exception as e:
+            outcomes.append((None, e))
+    return outcomes
+
+def report_calculator_test(number, test, result, error):
+    """Write one scenario's report in one go; returns whether it passed"""
+    title = test['title']
+    lines = [
+        "=" * 80,
+        f"TEST {number}: {title} CALCULATOR",
+        "=" * 80,
+        "Requirements:",
+        *(f"- {requirement}" for requirement in test['requirements']),
+        ""
+    ]
     
     try:
-        result = calculator.calculate_circuit_breaker_sizing(
-            continuous_load=34.0,
-            non_continuous_load=0.0,
-            voltage=480.0,
-            ambient_temperature=40.0,
-            application_type="motor",
-            short_circuit_current=10000
-        )
+        if error is not None:
+            raise error
         
-        print("CIRCUIT BREAKER SIZING RESULTS:")
-        print("-" * 50)
-        print(f"✓ Recommended Breaker Size: {result.get('breaker_size', 'N/A')} A")
-        print(f"✓ Total Load: {result.get('total_load', 'N/A')} A")
-        print(f"✓ Continuous Load: {result.get('continuous_load', 'N/A')} A")
-        print(f"✓ Calculation Method: {result.get('calculation_method', 'N/A')}")
-        print(f"✓ Safety Factor: {result.get('safety_factor', 'N/A')}")
-        print(f"✓ Temperature Derating: {result.get('temperature_derating', 'N/A')}")
-        print(f"✓ Interrupting Capacity: {result.get('interrupting_capacity', 'N/A'):,} A")
-        print(f"✓ Wire Ampacity Required: {result.get('wire_ampacity_required', 'N/A')} A")
-        print(f"✓ Short Circuit Capacity: {result.get('short_circuit_capacity', 'N/A')}")
-        print(f"✓ NEC Compliance: {'✅ YES' if result.get('nec_compliant', False) else '❌ NO'}")
-        print(f"✓ NEC Reference: {result.get('nec_reference', 'N/A')}")
-        print()
-        print("ANALYSIS:")
-        print(f"• Breaker sized per NEC 430.52 for motor protection")
-        print(f"• 125% safety factor applied for continuous operation")
-        print(f"• Suitable for 25HP motor with 34A FLA")
-        print(f"• Interrupting capacity exceeds available fault current")
-        print(f"• {result.get('notes', 'No additional notes')}")
-        print()
+        # Look the bound method up once rather than once per field
+        get = result.get
+        values = {'notes': get('notes', 'No additional notes')}
+        for label, key, default, fmt in test['fields'] + NEC_FIELDS:
+            value = get(key, default)
+            values[key] = fmt(value) if callable(fmt) else value
+        report = test['template'].format_map(values)
+        if VERBOSE:
+            sys.stdout.write("\n".join(lines) + "\n" + report)
         
         return True
         
     except Exception as e:
-        print(f"❌ Error in circuit breaker sizing calculation: {e}")
-        import traceback
-        traceback.print_exc()
+        lines.append(f"❌ Error in {title.lower()} calculation: {e}")
+        sys.stdout.write("\n".join(lines if VERBOSE else lines[-1:]) + "\n")
+        if VERBOSE:
+            # Into the buffered report, so it follows its error line
+            traceback.print_exc(file=sys.stdout)
         return False
 
+# Static report text, assembled once at import
+TIME_SAVINGS_TEXT = "\n".join([
+    "=" * 80,
+    "TIME SAVINGS ANALYSIS",
+    "=" * 80,
+    "Manual Calculation Time (Traditional Method):",
+    "• Cable Sizing: 2-4 hours (lookup tables, calculations, verification)",
+    "• Motor Selection: 3-5 hours (catalog search, efficiency analysis, sizing)",
+    "• Circuit Breaker Sizing: 1-2 hours (NEC code lookup, calculations)",
+    "• Total Manual Time: 6-11 hours per project",
+    "",
+    "System Calculation Time (Our Calculators):",
+    "• Cable Sizing: ~30 seconds",
+    "• Motor Sizing: ~45 seconds",
+    "• Circuit Breaker Sizing: ~30 seconds",
+    "• Total System Time: ~2 minutes per project",
+    "",
+    "Time Savings:",
+    "• Time Reduction: 95-97%",
+    "• Accuracy Improvement: NEC 2023 compliance guaranteed",
+    "• Productivity Gain: 360x faster than manual methods",
+    "",
+    ""
+])
+
 def demonstrate_time_savings():
     """Demonstrate the time savings compared to manual calculations"""
-    print("=" * 80)
-    print("TIME SAVINGS ANALYSIS")
-    print("=" * 80)
-    
-    print("Manual Calculation Time (Traditional Method):")
-    print("• Cable Sizing: 2-4 hours (lookup tables, calculations, verification)")
-    print("• Motor Selection: 3-5 hours (catalog search, efficiency analysis, sizing)")
-    print("• Circuit Breaker Sizing: 1-2 hours (NEC code lookup, calculations)")
-    print("• Total Manual Time: 6-11 hours per project")
-    print()
-    
-    print("System Calculation Time (Our Calculators):")
-    print("• Cable Sizing: ~30 seconds")
-    print("• Motor Sizing: ~45 seconds") 
-    print("• Circuit Breaker Sizing: ~30 seconds")
-    print("• Total System Time: ~2 minutes per project")
-    print()
-    
-    print("Time Savings:")
-    print("• Time Reduction: 95-97%")
-    print("• Accuracy Improvement: NEC 2023 compliance guaranteed")
-    print("• Productivity Gain: 360x faster than manual methods")
-    print()
+    if VERBOSE:
+        sys.stdout.write(TIME_SAVINGS_TEXT)
 
-def main():
-    """Run all tests"""
-    print("ELECTRICAL MAINTENANCE CALCULATORS - REAL-WORLD TEST")
-    print("Testing three specific scenarios as requested")
-    print("Using FIXED calculator implementations")
-    print()
+def run_all_tests():
+    """Run all tests; returns how many passed"""
+    if VERBOSE:
+        sys.stdout.writelines([
+            "ELECTRICAL MAINTENANCE CALCULATORS - REAL-WORLD TEST\n",
+            "Testing three specific scenarios as requested\n",
+            "Using FIXED calculator implementations\n",
+            "\n"
+        ])
     
     success_count = 0
-    total_tests = 3
-    
-    # Test 1: Cable Sizing
-    if test_cable_sizing():
-        success_count += 1
-    
-    # Test 2: Motor Sizing  
-    if test_motor_sizing():
-        success_count += 1
+    total_tests = len(CALCULATOR_TESTS)
     
-    # Test 3: Circuit Breaker Sizing
-    if test_circuit_breaker():
-        success_count += 1
+    # All calculations run back to back, then the reports are rendered
+    outcomes = run_calculations(CALCULATOR_TESTS)
+    for number, (test, (result, error)) in enumerate(zip(CALCULATOR_TESTS, outcomes), 1):
+        if report_calculator_test(number, test, result, error):
+            success_count += 1
     
     # Demonstrate time savings
     demonstrate_time_savings()
     
     # Summary
-    print("=" * 80)
-    print("TEST SUMMARY")
-    print("=" * 80)
-    print(f"✅ Tests Passed: {success_count}/{total_tests}")
-    print(f"✅ Success Rate: {(success_count/total_tests)*100:.1f}%")
+    lines = [
+        "=" * 80 + "\n",
+        "TEST SUMMARY\n",
+        "=" * 80 + "\n",
+        f"✅ Tests Passed: {success_count}/{total_tests}\n",
+        f"✅ Success Rate: {(success_count/total_tests)*100:.1f}%\n"
+    ]
     
     if success_count == total_tests:
-        print("\n🎉 ALL CALCULATORS WORKING CORRECTLY")
-        print("🎉 Ready for production use")
-        print("\nThe fixed calculators provide:")
-        print("✅ NEC 2023 compliant calculations")
-        print("✅ Real-time cable sizing with voltage drop analysis")
-        print("✅ Motor selection with efficiency and cost analysis")
-        print("✅ Circuit breaker sizing with safety factors")
-        print("✅ Comprehensive error handling")
-        print("✅ Professional results with NEC references")
-        print("\n🚀 READY FOR API INTEGRATION PHASE")
+        lines += [
+            "\n🎉 ALL CALCULATORS WORKING CORRECTLY\n",
+            "🎉 Ready for production use\n",
+            "\nThe fixed calculators provide:\n",
+            "✅ NEC 2023 compliant calculations\n",
+            "✅ Real-time cable sizing with voltage drop analysis\n",
+            "✅ Motor selection with efficiency and cost analysis\n",
+            "✅ Circuit breaker sizing with safety factors\n",
+            "✅ Comprehensive error handling\n",
+            "✅ Professional results with NEC references\n",
+            "\n🚀 READY FOR API INTEGRATION PHASE\n"
+        ]
     else:
-        print("\n❌ Some calculators need additional debugging")
-        print("❌ Review error messages above")
+        lines += [
+            "\n❌ Some calculators need additional debugging\n",
+            "❌ Review error messages above\n"
+        ]
+    sys.stdout.writelines(lines)
+    return success_count
+
+def main():
+    """Run all tests, writing the whole report to stdout in one go"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            success_count = run_all_tests()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+    
+    if success_count < len(CALCULATOR_TESTS):
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Tests for voltage matching in sizing_recommendation_engine
+"""
+
+from sizing_recommendation_engine import CircuitBreakerRecommendationEngine, MotorRecommendationEngine
+
+def part_numbers(recommendations):
+    return {manufacturer: [part.part_number for part in parts] for manufacturer, parts in recommendations.items()}
+
+def test_empty_breaker_voltage_accepts_every_rating():
+    engine = CircuitBreakerRecommendationEngine()
+
+    recommendations = part_numbers(engine.recommend_circuit_breakers(100, ''))
+
+    # 480V-rated breakers are only rejected for a voltage they do not list
+    assert any(recommendations.values())
+    assert recommendations == part_numbers(engine.recommend_circuit_breakers(100, '480V'))
+    assert [part_numbers(batch) for batch in engine.recommend_batch([100], [''])] == [recommendations]
+
+def test_empty_motor_voltage_accepts_every_rating():
+    engine = MotorRecommendationEngine()
+
+    recommendations = part_numbers(engine.recommend_motors(10, ''))
+
+    assert any(recommendations.values())
+    assert recommendations == part_numbers(engine.recommend_motors(10, '480V'))
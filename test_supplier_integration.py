@@ -0,0 +1,58 @@
+"""
+Tests for the BOM report in supplier_integration
+"""
+
+from types import SimpleNamespace
+
+from supplier_integration import ElectricalComponentsDatabase
+
+def make_component(**overrides):
+    """Plain attribute object shaped like an ElectricalComponent row"""
+    values = {
+        "manufacturer": "Schneider Electric",
+        "part_number": "LC1D09M7",
+        "description": "TeSys D Contactor, 3P, 9A, 220V AC Coil",
+        "category": "Contactor",
+        "voltage_rating": "690V",
+        "current_rating": "9A",
+        "datasheet_url": "https://www.se.com/ww/en/product/LC1D09M7/",
+        "ul_certified": True,
+        "nec_compliant": True,
+        "price_usd": 45.0,
+        "stock_available": 12,
+        "lead_time_days": 3,
+        "supplier_id": "Schneider Direct",
+        "manufacturer_url": "https://www.se.com/"
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+def test_bom_report_accepts_non_dataclass_components():
+    database = ElectricalComponentsDatabase({})
+    components = [
+        make_component(),
+        make_component(part_number="A9F74106", price_usd=12.5, ul_certified=False)
+    ]
+
+    report = database.generate_bom_report(components)
+
+    assert report["summary"]["total_parts"] == 2
+    assert report["summary"]["total_cost"] == 57.5
+    assert report["summary"]["ul_certified_count"] == 1
+    assert report["certification_summary"]["non_ul_certified"] == ["A9F74106"]
+    assert [row["part_number"] for row in report["components"]] == ["LC1D09M7", "A9F74106"]
+
+def test_bom_report_keeps_missing_values_as_none():
+    database = ElectricalComponentsDatabase({})
+    components = [
+        make_component(),
+        make_component(part_number="CL00A310T", manufacturer=None, datasheet_url=None, stock_available=None)
+    ]
+
+    report = database.generate_bom_report(components)
+
+    assert report["summary"]["unique_manufacturers"] == 2
+    row = report["components"][1]
+    assert row["manufacturer"] is None
+    assert row["datasheet_url"] is None
+    assert row["stock"] is None
@@ -1,79 +1,159 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 BASE_URL = "http://127.0.0.1:5000"
 
+# (connect, read) seconds; a hung server fails the check instead of the whole run
+REQUEST_TIMEOUT = (2.0, 5.0)
+
+# One keep-alive session for every check instead of a new connection per request.
+# The calculator endpoints are idempotent, so POSTs answered with a transient
+# gateway error are retried; request bodies are encoded here, so the session
+# declares their content type.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                      allowed_methods=None, raise_on_status=False)
+))
+SESSION.headers["Content-Type"] = "application/json"
+
+def encode_json(data):
+    """Request body bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def decode_json(content):
+    """Parse a response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def pretty_json(data):
+    """Indented JSON for the report, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+# Endpoint checks as (name, url, payload); they are independent of each other
+ENDPOINT_CHECKS = [
+    # 1. Voltage Drop
+    ("Voltage Drop", "/api/calculate/voltage-drop", {
+        "voltage": 480, "current": 50, "distance_ft": 200, "conductor_size": "6"
+    }),
+    
+    # 2. Fault Current
+    ("Fault Current", "/api/calculate/fault-current", {
+        "source_voltage": 480, "transformer_kva": 1000, "transformer_impedance": 5.75
+    }),
+    
+    # 3. Cable Sizing
+    ("Cable Sizing", "/api/calculate/cable-sizing", {
+        "current_amps": 100, "voltage": 480
+    }),
+    
+    # 4. Breaker Sizing
+    ("Breaker Sizing", "/api/calculate/breaker-sizing", {
+        "load_amps": 45, "load_type": "continuous"
+    }),
+    
+    # 5. Motor Startup
+    ("Motor Startup", "/api/calculate/motor-startup", {
+        "motor_hp": 50, "voltage": 480, "method": "soft_start"
+    }),
+]
+
+def wait_for_server(timeout=2.0):
+    """Poll the app until it answers, giving up after timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            SESSION.get(f"{BASE_URL}/", timeout=0.2)
+            return True
+        except requests.RequestException:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+
 def test_endpoint(name, url, data):
-    print(f"Testing {name}...")
+    """Run one calculator check; returns (passed, report lines)"""
+    lines = [f"Testing {name}..."]
     try:
-        response = requests.post(f"{BASE_URL}{url}", json=data)
+        response = SESSION.post(f"{BASE_URL}{url}", data=encode_json(data), timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
-            result = response.json()
+            result = decode_json(response.content)
             if result.get('success'):
-                print(f"  [PASS] {name}: {json.dumps(result['result'], indent=2)}")
-                return True
+                lines.append(f"  [PASS] {name}: {pretty_json(result['result'])}")
+                return True, lines
             else:
-                print(f"  [FAIL] {name}: {result.get('error')}")
+                lines.append(f"  [FAIL] {name}: {result.get('error')}")
         else:
-            print(f"  [FAIL] {name}: Status {response.status_code}")
+            lines.append(f"  [FAIL] {name}: Status {response.status_code}")
     except Exception as e:
-        print(f"  [FAIL] {name}: {e}")
-    return False
+        lines.append(f"  [FAIL] {name}: {e}")
+    return False, lines
 
 def test_supplier_search():
-    print("Testing Real Supplier Search...")
+    """Run the supplier search check; returns (passed, report lines)"""
+    lines = ["Testing Real Supplier Search..."]
     try:
         data = {"part_number": "LC1D09M7"} # Real Schneider part
-        response = requests.post(f"{BASE_URL}/api/suppliers/search", json=data)
+        response = SESSION.post(f"{BASE_URL}/api/suppliers/search", data=encode_json(data), timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
-            result = response.json()
-            if result.get('success') and result.get('components'):
-                comp = result['components'][0]
-                print(f"  [PASS] Found Real Component: {comp['manufacturer']} {comp['part_number']}")
-                print(f"         Price: ${comp['price']:.2f} (Live Scraped)")
-                return True
+            result = decode_json(response.content)
+            components = result.get('components')
+            if result.get('success') and components:
+                comp = components[0]
+                lines.append(f"  [PASS] Found Real Component: {comp['manufacturer']} {comp['part_number']}")
+                lines.append(f"         Price: ${comp['price']:.2f} (Live Scraped)")
+                return True, lines
             else:
-                print(f"  [FAIL] Supplier Search: {result.get('error')}")
+                lines.append(f"  [FAIL] Supplier Search: {result.get('error')}")
         else:
-            print(f"  [FAIL] Supplier Search: Status {response.status_code}")
+            lines.append(f"  [FAIL] Supplier Search: Status {response.status_code}")
     except Exception as e:
-        print(f"  [FAIL] Supplier Search: {e}")
-    return False
+        lines.append(f"  [FAIL] Supplier Search: {e}")
+    return False, lines
 
 def main():
     print("=== Verifying Refined Application ===")
     
     # Wait for app to reload if needed
-    time.sleep(2)
+    if not wait_for_server():
+        print(f"[FAIL] Server not reachable at {BASE_URL}; start it with 'python run.py' and retry")
+        SESSION.close()
+        sys.exit(1)
     
-    # 1. Voltage Drop
-    test_endpoint("Voltage Drop", "/api/calculate/voltage-drop", {
-        "voltage": 480, "current": 50, "distance_ft": 200, "conductor_size": "6"
-    })
+    # The checks run concurrently; reports are printed in submission order
+    # so the output reads the same as a sequential run
+    with ThreadPoolExecutor(max_workers=len(ENDPOINT_CHECKS) + 1) as executor:
+        futures = [executor.submit(test_endpoint, *check) for check in ENDPOINT_CHECKS]
+        # 6. Real Supplier Search
+        futures.append(executor.submit(test_supplier_search))
+        results = [future.result() for future in futures]
     
-    # 2. Fault Current
-    test_endpoint("Fault Current", "/api/calculate/fault-current", {
-        "source_voltage": 480, "transformer_kva": 1000, "transformer_impedance": 5.75
-    })
+    sys.stdout.writelines(line + "\n" for passed, lines in results for line in lines)
     
-    # 3. Cable Sizing
-    test_endpoint("Cable Sizing", "/api/calculate/cable-sizing", {
-        "current_amps": 100, "voltage": 480
-    })
-    
-    # 4. Breaker Sizing
-    test_endpoint("Breaker Sizing", "/api/calculate/breaker-sizing", {
-        "load_amps": 45, "load_type": "continuous"
-    })
-    
-    # 5. Motor Startup
-    test_endpoint("Motor Startup", "/api/calculate/motor-startup", {
-        "motor_hp": 50, "voltage": 480, "method": "soft_start"
-    })
+    SESSION.close()
     
-    # 6. Real Supplier Search
-    test_supplier_search()
+    passed_count = sum(passed for passed, lines in results)
+    failed_count = len(results) - passed_count
+    print(f"\n=== {passed_count}/{len(results)} checks passed ===")
+    if failed_count:
+        print(f"[FAIL] {failed_count} check(s) failed")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()